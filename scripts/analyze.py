@@ -6,8 +6,8 @@ Run: python scripts/analyze.py --output data/processed/insights_report.md
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
 from datetime import date
-from decimal import Decimal
 from pathlib import Path
 
 import click
@@ -16,7 +16,7 @@ from rich.console import Console
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from sqlalchemy import case, select, func, desc, distinct
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import Session
 
 from src.storage.database import Database
 from src.storage.models import (
@@ -63,17 +63,33 @@ CATEGORY_DISPLAY = {
 }
 
 
-def generate_report(db: Database) -> str:
-    """Generate a markdown insights report."""
-    sections = []
+def write_report(db: Database, out_path: Path) -> int:
+    """Write the markdown insights report to ``out_path``.
+
+    Each section is written as soon as its query completes rather than
+    accumulating the whole report in memory. Returns the number of lines.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    line_count = 0
+    with db.get_session() as session, out_path.open("w", encoding="utf-8") as f:
+        for i, block in enumerate(_report_sections(session)):
+            if i:
+                f.write("\n")
+            f.write(block)
+            line_count += block.count("\n") + 1
+    return line_count
+
+
+def _report_sections(session: Session) -> Iterator[str]:
+    """Run the report queries on one session, yielding markdown blocks in order."""
 
     # ── Header ──
-    sections.append("# AG Enforcement Tracker — Insights Report")
-    sections.append(f"\n*Generated: {date.today().isoformat()}*\n")
+    yield "# AG Enforcement Tracker — Insights Report"
+    yield f"\n*Generated: {date.today().isoformat()}*\n"
 
     # ── Methodology ──
-    sections.append("## Methodology\n")
-    sections.append(
+    yield "## Methodology\n"
+    yield (
         "This report is generated by an automated pipeline that scrapes press releases from "
         "state Attorney General websites, extracts structured enforcement action data using "
         "rule-based pattern matching (regex and keyword heuristics), and normalizes entities, "
@@ -84,75 +100,62 @@ def generate_report(db: Database) -> str:
     )
 
     # ── Overview stats ──
-    with db.get_session() as session:
-        total_actions_all = session.execute(
-            select(func.count(EnforcementAction.id))
-        ).scalar_one()
-
-        # Active enforcement records (quality > 0.1)
-        total_actions = session.execute(
-            select(func.count(EnforcementAction.id))
-            .where(EnforcementAction.quality_score > 0.1)
-        ).scalar_one()
-
-        filtered_out = total_actions_all - total_actions
-
-        total_defendants = session.execute(
-            select(func.count(Defendant.id))
-        ).scalar_one()
-
-        total_monetary = session.execute(
-            select(func.sum(MonetaryTerms.total_amount))
-            .join(EnforcementAction)
-            .where(EnforcementAction.quality_score > 0.1)
-            .where(MonetaryTerms.total_amount > 0)
-        ).scalar_one() or Decimal("0")
-
-        states_with_data = session.execute(
-            select(func.count(distinct(EnforcementAction.state)))
-            .where(EnforcementAction.quality_score > 0.1)
-        ).scalar_one()
-
-        multistate_count = session.execute(
-            select(func.count(EnforcementAction.id))
-            .where(EnforcementAction.is_multistate == True)
-            .where(EnforcementAction.quality_score > 0.1)
-        ).scalar_one()
-
-    sections.append("## Overview\n")
-    sections.append(f"| Metric | Value |")
-    sections.append(f"|--------|-------|")
-    sections.append(f"| Enforcement Actions (active) | {total_actions:,} |")
-    sections.append(f"| Press Releases Scraped | {total_actions_all:,} |")
-    sections.append(f"| Filtered as Non-Enforcement | {filtered_out:,} |")
-    sections.append(f"| Total Defendants | {total_defendants:,} |")
-    sections.append(f"| Total Monetary Value | ${float(total_monetary):,.0f} |")
-    sections.append(f"| States Tracked | {states_with_data} |")
-    sections.append(f"| Multistate Actions | {multistate_count:,} |")
+    # Active enforcement records are those with quality > 0.1; all the
+    # action-level counts come back from one filtered-aggregate SELECT.
+    active = EnforcementAction.quality_score > 0.1
+    total_actions_all, total_actions, states_with_data, multistate_count, total_defendants = session.execute(
+        select(
+            func.count(EnforcementAction.id),
+            func.count(EnforcementAction.id).filter(active),
+            func.count(distinct(EnforcementAction.state)).filter(active),
+            func.count(EnforcementAction.id).filter(active, EnforcementAction.is_multistate == True),
+            select(func.count(Defendant.id)).scalar_subquery(),
+        )
+    ).one()
+
+    filtered_out = total_actions_all - total_actions
+
+    total_monetary = session.execute(
+        select(func.coalesce(func.sum(MonetaryTerms.total_amount), 0))
+        .join(EnforcementAction)
+        .where(active)
+        .where(MonetaryTerms.total_amount > 0)
+    ).scalar_one()
+
+    yield "## Overview\n"
+    yield f"| Metric | Value |"
+    yield f"|--------|-------|"
+    yield f"| Enforcement Actions (active) | {total_actions:,} |"
+    yield f"| Press Releases Scraped | {total_actions_all:,} |"
+    yield f"| Filtered as Non-Enforcement | {filtered_out:,} |"
+    yield f"| Total Defendants | {total_defendants:,} |"
+    yield f"| Total Monetary Value | ${float(total_monetary):,.0f} |"
+    yield f"| States Tracked | {states_with_data} |"
+    yield f"| Multistate Actions | {multistate_count:,} |"
 
     # ── Data Coverage ──
-    sections.append("\n## Data Coverage\n")
-
-    with db.get_session() as session:
-        coverage = session.execute(
-            select(
-                EnforcementAction.state,
-                func.count(EnforcementAction.id).label("count"),
-                func.min(EnforcementAction.date_announced).label("earliest"),
-                func.max(EnforcementAction.date_announced).label("latest"),
-            )
-            .where(EnforcementAction.quality_score > 0.1)
-            .group_by(EnforcementAction.state)
-            .order_by(desc("count"))
-        ).all()
-
-    sections.append("| State | Records | Earliest | Latest |")
-    sections.append("|-------|---------|----------|--------|")
-    for state_code, count, earliest, latest in coverage:
-        name = STATE_NAMES.get(state_code, state_code)
-        sections.append(f"| {name} ({state_code}) | {count:,} | {earliest} | {latest} |")
-
-    sections.append(
+    yield "\n## Data Coverage\n"
+
+    coverage = session.execute(
+        select(
+            EnforcementAction.state,
+            func.count(EnforcementAction.id).label("count"),
+            func.min(EnforcementAction.date_announced).label("earliest"),
+            func.max(EnforcementAction.date_announced).label("latest"),
+        )
+        .where(EnforcementAction.quality_score > 0.1)
+        .group_by(EnforcementAction.state)
+        .order_by(desc("count"))
+    ).all()
+
+    yield "| State | Records | Earliest | Latest |"
+    yield "|-------|---------|----------|--------|"
+    yield from (
+        f"| {STATE_NAMES.get(state_code, state_code)} ({state_code}) | {count:,} | {earliest} | {latest} |"
+        for state_code, count, earliest, latest in coverage
+    )
+
+    yield (
         "\n**Known limitations:** Coverage varies by state based on website structure "
         "and archive depth. Some states' AG websites have limited historical archives. "
         "Virginia and Pennsylvania have minimal records due to website structure limitations. "
@@ -161,55 +164,47 @@ def generate_report(db: Database) -> str:
     )
 
     # ── Insight 1: Enforcement by State ──
-    sections.append("\n## Insight 1: Enforcement Activity by State\n")
-
-    with db.get_session() as session:
-        by_state = session.execute(
-            select(
-                EnforcementAction.state,
-                func.count(EnforcementAction.id).label("count"),
-            )
-            .where(EnforcementAction.quality_score > 0.1)
-            .group_by(EnforcementAction.state)
-            .order_by(desc("count"))
-        ).all()
-
-    sections.append("| State | Actions | Share |")
-    sections.append("|-------|---------|-------|")
-    for state_code, count in by_state:
-        name = STATE_NAMES.get(state_code, state_code)
-        pct = (count / total_actions * 100) if total_actions else 0
-        sections.append(f"| {name} ({state_code}) | {count:,} | {pct:.1f}% |")
+    yield "\n## Insight 1: Enforcement Activity by State\n"
+
+    # Same GROUP BY as the coverage table — reuse it instead of re-querying
+    by_state = [(state_code, count) for state_code, count, _, _ in coverage]
+
+    yield "| State | Actions | Share |"
+    yield "|-------|---------|-------|"
+    yield from (
+        f"| {STATE_NAMES.get(state_code, state_code)} ({state_code}) | {count:,} | "
+        f"{(count / total_actions * 100) if total_actions else 0:.1f}% |"
+        for state_code, count in by_state
+    )
 
     top_state = by_state[0] if by_state else None
     if top_state:
-        sections.append(
+        yield (
             f"\n**{STATE_NAMES.get(top_state[0], top_state[0])}** leads with "
             f"{top_state[1]:,} enforcement actions ({top_state[1]/total_actions*100:.0f}% of total)."
         )
 
     # ── Insight 2: Settlement Amounts (deduplicated) ──
-    sections.append("\n## Insight 2: Largest Settlements\n")
-    sections.append(
+    yield "\n## Insight 2: Largest Settlements\n"
+    yield (
         "*Multistate settlements are shown once with participating state count. "
         "Settlements with the same dollar amount appearing from multiple states "
         "within one year are grouped as a single action.*\n"
     )
 
-    with db.get_session() as session:
-        all_settlements = session.execute(
-            select(
-                EnforcementAction.headline,
-                EnforcementAction.state,
-                EnforcementAction.date_announced,
-                MonetaryTerms.total_amount,
-                EnforcementAction.is_multistate,
-            )
-            .join(MonetaryTerms)
-            .where(MonetaryTerms.total_amount > 0)
-            .where(EnforcementAction.quality_score > 0.1)
-            .order_by(desc(MonetaryTerms.total_amount))
-        ).all()
+    all_settlements = session.execute(
+        select(
+            EnforcementAction.headline,
+            EnforcementAction.state,
+            EnforcementAction.date_announced,
+            MonetaryTerms.total_amount,
+            EnforcementAction.is_multistate,
+        )
+        .join(MonetaryTerms)
+        .where(MonetaryTerms.total_amount > 0)
+        .where(EnforcementAction.quality_score > 0.1)
+        .order_by(desc(MonetaryTerms.total_amount))
+    ).all()
 
     # Deduplicate: group settlements with same amount (within 1%) and dates within 1 year
     deduped: list[dict] = []
@@ -241,8 +236,8 @@ def generate_report(db: Database) -> str:
         if len(deduped) >= 10:
             break
 
-    sections.append("| # | Settlement | Scope | Date | Amount |")
-    sections.append("|---|-----------|-------|------|--------|")
+    yield "| # | Settlement | Scope | Date | Amount |"
+    yield "|---|-----------|-------|------|--------|"
     for i, row in enumerate(deduped, 1):
         amt = row["amount"]
         amt_str = _format_amount(amt)
@@ -253,20 +248,20 @@ def generate_report(db: Database) -> str:
             scope = f"{row['states'][0]} (multistate)"
         else:
             scope = row["states"][0]
-        sections.append(f"| {i} | {headline} | {scope} | {row['date']} | {amt_str} |")
+        yield f"| {i} | {headline} | {scope} | {row['date']} | {amt_str} |"
 
     if deduped:
         top_amt = deduped[0]["amount"]
         median_idx = len(deduped) // 2
         median_amt = deduped[median_idx]["amount"]
-        sections.append(
+        yield (
             f"\nThe largest settlement is **{_format_amount(top_amt)}**. "
             f"The median of the top 10 is **{_format_amount(median_amt)}**."
         )
 
     # ── Top Multistate Actions ──
-    sections.append("\n### Top Multistate Actions\n")
-    sections.append("Coordinated enforcement efforts involving multiple state AG offices:\n")
+    yield "\n### Top Multistate Actions\n"
+    yield "Coordinated enforcement efforts involving multiple state AG offices:\n"
 
     multistate_actions = [d for d in deduped if d["state_count"] > 1]
     if not multistate_actions:
@@ -275,160 +270,157 @@ def generate_report(db: Database) -> str:
             multistate_actions.append(row)
 
     if multistate_actions:
-        sections.append("| Action | States | Amount |")
-        sections.append("|--------|--------|--------|")
+        yield "| Action | States | Amount |"
+        yield "|--------|--------|--------|"
         for row in multistate_actions[:10]:
             headline = row["headline"][:60] + ("..." if len(row["headline"]) > 60 else "")
             states_str = ", ".join(row["states"])
-            sections.append(f"| {headline} | {states_str} ({row['state_count']} states) | {_format_amount(row['amount'])} |")
+            yield f"| {headline} | {states_str} ({row['state_count']} states) | {_format_amount(row['amount'])} |"
     else:
-        sections.append("No multistate actions with monetary settlements found in the dataset.")
+        yield "No multistate actions with monetary settlements found in the dataset."
 
     # ── Insight 3: Violation Categories ──
-    sections.append("\n## Insight 3: Most Common Violation Categories\n")
-
-    with db.get_session() as session:
-        by_category = session.execute(
-            select(
-                ViolationCategory.category,
-                func.count(ViolationCategory.id).label("count"),
-            )
-            .group_by(ViolationCategory.category)
-            .order_by(desc("count"))
-        ).all()
-
-    sections.append("| Category | Actions | Share |")
-    sections.append("|----------|---------|-------|")
+    yield "\n## Insight 3: Most Common Violation Categories\n"
+
+    by_category = session.execute(
+        select(
+            ViolationCategory.category,
+            func.count(ViolationCategory.id).label("count"),
+        )
+        .group_by(ViolationCategory.category)
+        .order_by(desc("count"))
+    ).all()
+
+    yield "| Category | Actions | Share |"
+    yield "|----------|---------|-------|"
     total_cats = sum(c for _, c in by_category)
-    for cat, count in by_category:
-        display = CATEGORY_DISPLAY.get(cat, cat)
-        pct = (count / total_cats * 100) if total_cats else 0
-        sections.append(f"| {display} | {count} | {pct:.1f}% |")
+    yield from (
+        f"| {CATEGORY_DISPLAY.get(cat, cat)} | {count} | {(count / total_cats * 100) if total_cats else 0:.1f}% |"
+        for cat, count in by_category
+    )
 
     if by_category:
         top_cat = CATEGORY_DISPLAY.get(by_category[0][0], by_category[0][0])
-        sections.append(
+        yield (
             f"\n**{top_cat}** is the most common enforcement category, appearing in "
             f"{by_category[0][1]} categorizations ({by_category[0][1]/total_cats*100:.0f}% of all labels)."
         )
 
     # ── Insight 4: Action Types ──
-    sections.append("\n## Insight 4: Action Type Distribution\n")
-
-    with db.get_session() as session:
-        by_type = session.execute(
-            select(
-                EnforcementAction.action_type,
-                func.count(EnforcementAction.id).label("count"),
-            )
-            .where(EnforcementAction.quality_score > 0.1)
-            .group_by(EnforcementAction.action_type)
-            .order_by(desc("count"))
-        ).all()
-
-    sections.append("| Action Type | Count | Share |")
-    sections.append("|-------------|-------|-------|")
+    yield "\n## Insight 4: Action Type Distribution\n"
+
+    by_type = session.execute(
+        select(
+            EnforcementAction.action_type,
+            func.count(EnforcementAction.id).label("count"),
+        )
+        .where(EnforcementAction.quality_score > 0.1)
+        .group_by(EnforcementAction.action_type)
+        .order_by(desc("count"))
+    ).all()
+
+    yield "| Action Type | Count | Share |"
+    yield "|-------------|-------|-------|"
     active_total = sum(c for _, c in by_type)
-    for atype, count in by_type:
-        pct = (count / active_total * 100) if active_total else 0
-        sections.append(f"| {atype.replace('_', ' ').title()} | {count} | {pct:.1f}% |")
+    yield from (
+        f"| {atype.replace('_', ' ').title()} | {count} | {(count / active_total * 100) if active_total else 0:.1f}% |"
+        for atype, count in by_type
+    )
 
     settlements = next((c for t, c in by_type if t == "settlement"), 0)
     lawsuits = next((c for t, c in by_type if t == "lawsuit_filed"), 0)
     if settlements and lawsuits:
         ratio = settlements / lawsuits if lawsuits else 0
-        sections.append(
+        yield (
             f"\nSettlements outnumber lawsuits filed by **{ratio:.1f}x**, "
             f"suggesting most AG enforcement resolves through negotiated settlements."
         )
 
     # ── Insight 5: Cross-State Defendant Activity ──
-    sections.append("\n## Insight 5: Defendants Facing Actions in Multiple States\n")
-
-    with db.get_session() as session:
-        multi_state_defendants = session.execute(
-            select(
-                Defendant.canonical_name,
-                func.count(distinct(EnforcementAction.state)).label("state_count"),
-                func.count(ActionDefendant.action_id).label("action_count"),
-                func.group_concat(distinct(EnforcementAction.state)).label("states"),
-            )
-            .select_from(Defendant)
-            .join(ActionDefendant, ActionDefendant.defendant_id == Defendant.id)
-            .join(EnforcementAction, EnforcementAction.id == ActionDefendant.action_id)
-            .where(Defendant.canonical_name != "")
-            .group_by(Defendant.canonical_name)
-            .having(func.count(distinct(EnforcementAction.state)) > 1)
-            .order_by(desc("state_count"), desc("action_count"))
-        ).all()
+    yield "\n## Insight 5: Defendants Facing Actions in Multiple States\n"
+
+    multi_state_defendants = session.execute(
+        select(
+            Defendant.canonical_name,
+            func.count(distinct(EnforcementAction.state)).label("state_count"),
+            func.count(ActionDefendant.action_id).label("action_count"),
+            func.group_concat(distinct(EnforcementAction.state)).label("states"),
+        )
+        .select_from(Defendant)
+        .join(ActionDefendant, ActionDefendant.defendant_id == Defendant.id)
+        .join(EnforcementAction, EnforcementAction.id == ActionDefendant.action_id)
+        .where(Defendant.canonical_name != "")
+        .group_by(Defendant.canonical_name)
+        .having(func.count(distinct(EnforcementAction.state)) > 1)
+        .order_by(desc("state_count"), desc("action_count"))
+    ).all()
 
     if multi_state_defendants:
-        sections.append("| Defendant | States | Actions | States Involved |")
-        sections.append("|-----------|--------|---------|-----------------|")
-        for name, state_count, action_count, states in multi_state_defendants:
-            sections.append(f"| {name} | {state_count} | {action_count} | {states} |")
-        sections.append(
+        yield "| Defendant | States | Actions | States Involved |"
+        yield "|-----------|--------|---------|-----------------|"
+        yield from (
+            f"| {name} | {state_count} | {action_count} | {states} |"
+            for name, state_count, action_count, states in multi_state_defendants
+        )
+        yield (
             f"\n**{len(multi_state_defendants)} defendants** face enforcement actions in multiple states, "
             f"indicating cross-jurisdictional enforcement patterns."
         )
     else:
-        sections.append("No defendants currently appear in actions across multiple states in our dataset.")
+        yield "No defendants currently appear in actions across multiple states in our dataset."
 
     # ── Insight 6: Monetary Recovery by Category ──
-    sections.append("\n## Insight 6: Monetary Recovery by Violation Category\n")
-
-    with db.get_session() as session:
-        cat_amounts = session.execute(
-            select(
-                ViolationCategory.category,
-                func.sum(MonetaryTerms.total_amount).label("total"),
-                func.count(distinct(EnforcementAction.id)).label("count"),
-            )
-            .select_from(ViolationCategory)
-            .join(EnforcementAction, EnforcementAction.id == ViolationCategory.action_id)
-            .join(MonetaryTerms, MonetaryTerms.action_id == EnforcementAction.id)
-            .where(MonetaryTerms.total_amount > 0)
-            .group_by(ViolationCategory.category)
-            .order_by(desc("total"))
-        ).all()
+    yield "\n## Insight 6: Monetary Recovery by Violation Category\n"
+
+    cat_amounts = session.execute(
+        select(
+            ViolationCategory.category,
+            func.sum(MonetaryTerms.total_amount).label("total"),
+            func.count(distinct(EnforcementAction.id)).label("count"),
+            (func.sum(MonetaryTerms.total_amount) / func.count(distinct(EnforcementAction.id))).label("avg"),
+        )
+        .select_from(ViolationCategory)
+        .join(EnforcementAction, EnforcementAction.id == ViolationCategory.action_id)
+        .join(MonetaryTerms, MonetaryTerms.action_id == EnforcementAction.id)
+        .where(MonetaryTerms.total_amount > 0)
+        .group_by(ViolationCategory.category)
+        .order_by(desc("total"))
+    ).all()
 
     if cat_amounts:
-        sections.append("| Category | Total Amount | Actions | Avg per Action |")
-        sections.append("|----------|-------------|---------|----------------|")
-        for cat, total, count in cat_amounts:
-            display = CATEGORY_DISPLAY.get(cat, cat)
-            avg = float(total) / count if count else 0
-            sections.append(
-                f"| {display} | {_format_amount(float(total))} | {count} | {_format_amount(avg)} |"
-            )
+        yield "| Category | Total Amount | Actions | Avg per Action |"
+        yield "|----------|-------------|---------|----------------|"
+        yield from (
+            f"| {CATEGORY_DISPLAY.get(cat, cat)} | {_format_amount(float(total))} | {count} | "
+            f"{_format_amount(float(avg))} |"
+            for cat, total, count, avg in cat_amounts
+        )
 
     # ── Insight 7: Enforcement Trends Over Time ──
-    sections.append("\n## Insight 7: Enforcement Trends Over Time\n")
-
-    with db.get_session() as session:
-        month_col = func.strftime("%m", EnforcementAction.date_announced)
-        quarterly = session.execute(
-            select(
-                func.strftime("%Y", EnforcementAction.date_announced).label("year"),
-                case(
-                    (month_col.in_(["01", "02", "03"]), "Q1"),
-                    (month_col.in_(["04", "05", "06"]), "Q2"),
-                    (month_col.in_(["07", "08", "09"]), "Q3"),
-                    else_="Q4",
-                ).label("quarter"),
-                func.count(EnforcementAction.id).label("count"),
-            )
-            .where(EnforcementAction.quality_score > 0.1)
-            .where(EnforcementAction.date_announced >= "2022-01-01")
-            .group_by("year", "quarter")
-            .order_by("year", "quarter")
-        ).all()
+    yield "\n## Insight 7: Enforcement Trends Over Time\n"
+
+    month_col = func.strftime("%m", EnforcementAction.date_announced)
+    quarterly = session.execute(
+        select(
+            func.strftime("%Y", EnforcementAction.date_announced).label("year"),
+            case(
+                (month_col.in_(["01", "02", "03"]), "Q1"),
+                (month_col.in_(["04", "05", "06"]), "Q2"),
+                (month_col.in_(["07", "08", "09"]), "Q3"),
+                else_="Q4",
+            ).label("quarter"),
+            func.count(EnforcementAction.id).label("count"),
+        )
+        .where(EnforcementAction.quality_score > 0.1)
+        .where(EnforcementAction.date_announced >= "2022-01-01")
+        .group_by("year", "quarter")
+        .order_by("year", "quarter")
+    ).all()
 
     if quarterly:
-        sections.append("| Period | Actions |")
-        sections.append("|--------|---------|")
-        for year, quarter, count in quarterly:
-            sections.append(f"| {year} {quarter} | {count} |")
+        yield "| Period | Actions |"
+        yield "|--------|---------|"
+        yield from (f"| {year} {quarter} | {count} |" for year, quarter, count in quarterly)
 
         # Year-over-year comparison
         yearly_counts: dict[str, int] = {}
@@ -441,46 +433,42 @@ def generate_report(db: Database) -> str:
             if yearly_counts[prev_year] > 0:
                 change = (yearly_counts[latest_year] - yearly_counts[prev_year]) / yearly_counts[prev_year] * 100
                 direction = "increased" if change > 0 else "decreased"
-                sections.append(
+                yield (
                     f"\nEnforcement activity {direction} by **{abs(change):.0f}%** "
                     f"from {prev_year} ({yearly_counts[prev_year]:,} actions) to "
                     f"{latest_year} ({yearly_counts[latest_year]:,} actions)."
                 )
 
     # ── Insight 8: Data Quality Distribution ──
-    sections.append("\n## Insight 8: Data Quality Distribution\n")
-
-    with db.get_session() as session:
-        quality_dist = session.execute(
-            select(
-                func.round(EnforcementAction.quality_score, 1).label("bucket"),
-                func.count(EnforcementAction.id).label("count"),
-            )
-            .group_by("bucket")
-            .order_by("bucket")
-        ).all()
-
-        avg_quality = session.execute(
-            select(func.avg(EnforcementAction.quality_score))
-            .where(EnforcementAction.quality_score > 0.1)
-        ).scalar_one() or 0
-
-    sections.append("| Quality Score | Count |")
-    sections.append("|--------------|-------|")
-    for bucket, count in quality_dist:
-        sections.append(f"| {bucket:.1f} | {count} |")
-
-    sections.append(f"\nAverage quality score (active records): **{float(avg_quality):.2f}** (1.0 = perfect extraction)")
+    yield "\n## Insight 8: Data Quality Distribution\n"
+
+    quality_dist = session.execute(
+        select(
+            func.round(EnforcementAction.quality_score, 1).label("bucket"),
+            func.count(EnforcementAction.id).label("count"),
+        )
+        .group_by("bucket")
+        .order_by("bucket")
+    ).all()
+
+    avg_quality = session.execute(
+        select(func.coalesce(func.avg(EnforcementAction.quality_score), 0.0))
+        .where(EnforcementAction.quality_score > 0.1)
+    ).scalar_one()
+
+    yield "| Quality Score | Count |"
+    yield "|--------------|-------|"
+    yield from (f"| {bucket:.1f} | {count} |" for bucket, count in quality_dist)
+
+    yield f"\nAverage quality score (active records): **{float(avg_quality):.2f}** (1.0 = perfect extraction)"
 
     # ── Footer ──
-    sections.append("\n---")
-    sections.append(
+    yield "\n---"
+    yield (
         "\n*Report generated by AG Enforcement Tracker analytics pipeline. "
         "Data sourced from official state Attorney General websites.*"
     )
 
-    return "\n".join(sections)
-
 
 def _format_amount(amount: float) -> str:
     if amount >= 1e9:
@@ -501,14 +489,11 @@ def main(output_path, db_path):
     db = Database(db_path)
     db.create_tables()
 
-    report = generate_report(db)
-
     out = Path(output_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(report, encoding="utf-8")
+    line_count = write_report(db, out)
 
     console.print(f"Report written to [cyan]{out}[/cyan]")
-    console.print(f"({len(report.splitlines())} lines)")
+    console.print(f"({line_count} lines)")
 
 
 if __name__ == "__main__":
@@ -9,9 +9,9 @@ Run: python scripts/bulk_extract.py
 from __future__ import annotations
 
 import logging
-import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
 
@@ -20,7 +20,8 @@ import yaml
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from sqlalchemy import delete, select, func, update
+from sqlalchemy import delete, insert, select, func, text, update
+from sqlalchemy.orm import Session, raiseload
 
 from src.extractors.filter import is_enforcement_action
 from src.extractors.patterns import extract_announced_date
@@ -44,18 +45,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger("bulk_extract")
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Sentinel date used as fallback when scraper couldn't find a real date
 FALLBACK_DATE = date(2022, 1, 1)
 
 # Maximum plausible settlement amount — anything above is flagged
 MAX_PLAUSIBLE_AMOUNT = 50_000_000_000  # $50B
 
+# NY press-release URLs carry the publication year and usually the month:
+# /press-release/YYYY/MM/slug → YYYY-MM-15, /press-release/YYYY/slug →
+# YYYY-07-01 (mid-year approximation, 2020–2030 only). Parsed in SQL so the
+# URL fallback never materializes rows in Python.
+_URL_DATE_BACKFILL_SQL = text("""
+    UPDATE enforcement_actions AS ea
+    SET date_announced = u.new_date
+    FROM (
+        SELECT id,
+            CASE
+                WHEN tail GLOB '[0-9][0-9][0-9][0-9]/[0-9]/*'
+                     AND CAST(substr(tail, 1, 4) AS INTEGER) >= 1
+                     AND CAST(substr(tail, 6, 1) AS INTEGER) BETWEEN 1 AND 12
+                    THEN printf('%s-%02d-15', substr(tail, 1, 4), CAST(substr(tail, 6, 1) AS INTEGER))
+                WHEN tail GLOB '[0-9][0-9][0-9][0-9]/[0-9][0-9]/*'
+                     AND CAST(substr(tail, 1, 4) AS INTEGER) >= 1
+                     AND CAST(substr(tail, 6, 2) AS INTEGER) BETWEEN 1 AND 12
+                    THEN printf('%s-%02d-15', substr(tail, 1, 4), CAST(substr(tail, 6, 2) AS INTEGER))
+                WHEN tail GLOB '[0-9][0-9][0-9][0-9]/*'
+                     AND CAST(substr(tail, 1, 4) AS INTEGER) BETWEEN 2020 AND 2030
+                    THEN substr(tail, 1, 4) || '-07-01'
+            END AS new_date
+        FROM (
+            SELECT id, substr(source_url, instr(source_url, '/press-release/') + 15) AS tail
+            FROM enforcement_actions
+            WHERE date_announced = :fallback
+              AND raw_text != ''
+              AND source_url LIKE '%/press-release/%'
+        )
+    ) AS u
+    WHERE ea.id = u.id AND u.new_date IS NOT NULL
+""")
+
 
 def backfill_dates(db: Database) -> int:
-    """Fix records that have the fallback date (2022-01-01) by extracting from body text."""
-    fixed = 0
-    batch_size = 500
+    """Fix records that have the fallback date (2022-01-01).
 
+    Dates found in the body text win; records still on the fallback date
+    afterwards get a date derived from their URL, entirely in SQL.
+    """
     with db.get_session() as session:
         total = session.execute(
             select(func.count(EnforcementAction.id))
@@ -68,54 +105,42 @@ def backfill_dates(db: Database) -> int:
 
     logger.info("Backfilling dates for %d records with fallback date %s", total, FALLBACK_DATE)
 
-    # Load ALL fallback-date records at once (they're lightweight — just id, url, first 2000 chars of text)
+    # extract_announced_date never looks past the first 2000 chars, so slice
+    # in SQL and stream the rows instead of pulling every full body into memory
+    ids: list[str] = []
+    texts: list[str] = []
     with db.get_session() as session:
-        all_actions = session.execute(
-            select(EnforcementAction.id, EnforcementAction.raw_text, EnforcementAction.source_url)
+        rows = session.execute(
+            select(EnforcementAction.id, func.substr(EnforcementAction.raw_text, 1, 2000))
             .where(EnforcementAction.date_announced == FALLBACK_DATE)
             .where(EnforcementAction.raw_text != "")
-        ).all()
+            .execution_options(yield_per=500)
+        )
+        for action_id, head in rows:
+            ids.append(action_id)
+            texts.append(head)
+
+    # Date parsing is CPU-bound regex/dateparser work and independent per
+    # record, so fan it out across processes
+    with ProcessPoolExecutor() as executor:
+        extracted_dates = list(executor.map(extract_announced_date, texts, chunksize=64))
 
-    updates = []
-    for action_id, raw_text, source_url in all_actions:
-        extracted_date = extract_announced_date(raw_text)
-
-        # Try extracting from URL patterns
-        if not extracted_date and source_url:
-            # NY pattern with month: /press-release/YYYY/MM/slug
-            m = re.search(r'/press-release/(\d{4})/(\d{1,2})/', source_url)
-            if m:
-                try:
-                    extracted_date = date(int(m.group(1)), int(m.group(2)), 15)
-                except ValueError:
-                    pass
-            if not extracted_date:
-                # Year-only URL pattern (NY): /press-release/YYYY/slug
-                m = re.search(r'/press-release/(\d{4})/', source_url)
-                if m:
-                    year = int(m.group(1))
-                    if 2020 <= year <= 2030:
-                        extracted_date = date(year, 7, 1)  # mid-year approximation
-
-        if extracted_date and extracted_date != FALLBACK_DATE:
-            updates.append({"id": action_id, "date_announced": extracted_date})
-
-    # Apply all updates in batches
-    if updates:
-        for i in range(0, len(updates), batch_size):
-            batch = updates[i:i + batch_size]
-            with db.get_session() as session:
-                for upd in batch:
-                    session.execute(
-                        update(EnforcementAction)
-                        .where(EnforcementAction.id == upd["id"])
-                        .values(date_announced=upd["date_announced"])
-                    )
-                session.commit()
-            fixed = i + len(batch)
-            logger.info("  Backfilled %d/%d dates so far", fixed, total)
-
-    fixed = len(updates)
+    updates = [
+        {"id": action_id, "date_announced": extracted_date}
+        for action_id, extracted_date in zip(ids, extracted_dates, strict=True)
+        if extracted_date and extracted_date != FALLBACK_DATE
+    ]
+
+    with db.get_session() as session:
+        # Apply text-derived dates as a single executemany (ORM bulk UPDATE by primary key)
+        if updates:
+            session.execute(update(EnforcementAction), updates)
+        url_fixed = session.execute(
+            _URL_DATE_BACKFILL_SQL, {"fallback": FALLBACK_DATE.isoformat()}
+        ).rowcount
+        session.commit()
+
+    fixed = len(updates) + url_fixed
     logger.info("Date backfill complete: %d dates fixed out of %d", fixed, total)
     return fixed
 
@@ -149,9 +174,9 @@ def run_extraction(reprocess: bool = False):
     if reprocess:
         reset_extraction_data(db)
 
-    # Load taxonomy
+    # Load taxonomy (libyaml's C loader when PyYAML was built with it)
     with open(Path("config/taxonomy.yaml")) as f:
-        taxonomy = yaml.safe_load(f)
+        taxonomy = yaml.load(f, Loader=YAML_LOADER)
 
     extractor = PressReleaseExtractor(taxonomy)
     resolver = EntityResolver()
@@ -191,33 +216,41 @@ def run_extraction(reprocess: bool = False):
         "monetary_capped": 0,
     }
 
+    # Canonical name → existing Defendant id, so recurring defendants are
+    # linked rather than re-inserted
+    with db.get_session() as session:
+        defendant_ids: dict[str, str] = dict(session.execute(
+            select(Defendant.canonical_name, Defendant.id)
+            .where(Defendant.canonical_name != "")
+        ).all())
+
     batch_size = 100
+    last_id = ""
 
     while True:
+        # One session and one commit per batch instead of one per action
         with db.get_session() as session:
+            # Keyset pagination on id so each batch is an index seek past the
+            # previous one rather than a rescan from the start of the table
+            # process_action writes child rows by foreign key and never reads
+            # the relationship collections; raiseload turns any future lazy
+            # access into an error instead of a silent per-row N+1 query.
             actions = session.execute(
                 select(EnforcementAction)
+                .options(raiseload("*"))
                 .where(EnforcementAction.quality_score == 0.0)
                 .where(EnforcementAction.raw_text != "")
+                .where(EnforcementAction.id > last_id)
+                .order_by(EnforcementAction.id)
                 .limit(batch_size)
-                .offset(0)  # Always 0 because processed ones get quality_score > 0
             ).scalars().all()
 
-        if not actions:
-            break
-
-        for action in actions:
-            try:
-                process_action(db, action, extractor, resolver, stats)
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning("Error processing %s: %s", action.source_url, e)
-                # Mark as processed to avoid infinite loop
-                with db.get_session() as session:
-                    db_action = session.get(EnforcementAction, action.id)
-                    if db_action:
-                        db_action.quality_score = 0.1
-                        session.commit()
+            if not actions:
+                break
+            last_id = actions[-1].id
+
+            process_batch(session, actions, extractor, resolver, defendant_ids, stats)
+            session.commit()
 
         processed = stats["extracted"] + stats["filtered_out"] + stats["errors"]
         logger.info(
@@ -278,25 +311,62 @@ def run_extraction(reprocess: bool = False):
     logger.info("  Records still with fallback date: %d", fallback_dates)
 
 
+def process_batch(
+    session: Session,
+    actions: list[EnforcementAction],
+    extractor: PressReleaseExtractor,
+    resolver: EntityResolver,
+    defendant_ids: dict[str, str],
+    stats: dict,
+) -> None:
+    """Run process_action over one batch that shares ``session``.
+
+    Each action runs inside its own SAVEPOINT. If it raises, only its rows
+    are rolled back (along with any defendant ids or counters it recorded)
+    and it is marked 0.1 so it isn't picked up again; the rest of the batch
+    still commits.
+    """
+    for action in actions:
+        known_defendants = len(defendant_ids)
+        counters = dict(stats)
+        try:
+            with session.begin_nested():
+                process_action(session, action, extractor, resolver, defendant_ids, stats)
+        except Exception as e:
+            # Defendants created inside the savepoint no longer exist
+            for canonical in list(defendant_ids)[known_defendants:]:
+                del defendant_ids[canonical]
+            stats.update(counters)
+            stats["errors"] += 1
+            logger.warning("Error processing %s: %s", action.source_url, e)
+            # Mark as processed to avoid infinite loop
+            action.quality_score = 0.1
+
+
 def process_action(
-    db: Database,
+    session: Session,
     action: EnforcementAction,
     extractor: PressReleaseExtractor,
     resolver: EntityResolver,
+    defendant_ids: dict[str, str],
     stats: dict,
 ):
-    """Process a single enforcement action through the extraction pipeline."""
+    """Process a single enforcement action through the extraction pipeline.
+
+    Mutates ``action`` in place and adds related rows to ``session``; the
+    caller owns the transaction and commits once per batch.
+    ``defendant_ids`` maps canonical name → Defendant id for the whole run
+    and is updated with any defendants created here. Rows are written (and
+    flushed) as it goes, so an exception can leave this action half-written;
+    process_batch wraps each call in a SAVEPOINT to undo that.
+    """
     # Step 1: Non-enforcement filter
     filter_result = is_enforcement_action(action.headline, action.raw_text)
 
     if not filter_result.is_enforcement:
         stats["filtered_out"] += 1
-        with db.get_session() as session:
-            db_action = session.get(EnforcementAction, action.id)
-            if db_action:
-                db_action.quality_score = 0.15
-                db_action.action_type = "other"
-                session.commit()
+        action.quality_score = 0.15
+        action.action_type = "other"
         return
 
     # Step 2: Extract structured data
@@ -308,92 +378,117 @@ def process_action(
         body_text=action.raw_text,
     )
     result = extractor.extract(pr, date_announced=action.date_announced)
+    resolved = [
+        (d_schema, *resolver.resolve(d_schema.raw_name))
+        for d_schema in result.defendants
+    ]
 
     # Step 3: Update the main record
-    with db.get_session() as session:
-        db_action = session.get(EnforcementAction, action.id)
-        if not db_action:
-            return
-
-        db_action.action_type = result.action_type.value
-        db_action.status = result.status.value
-        db_action.summary = result.summary
-        db_action.is_multistate = result.is_multistate
-        db_action.quality_score = result.quality_score
-        db_action.extraction_method = result.extraction_method.value
-
-        if result.date_filed:
-            db_action.date_filed = result.date_filed
-        if result.date_resolved:
-            db_action.date_resolved = result.date_resolved
-
-        # Step 4: Add monetary terms (with sanity cap)
-        if result.monetary_terms:
-            total = result.monetary_terms.total_amount
-            is_estimated = result.monetary_terms.amount_is_estimated
-
-            # Sanity cap: flag amounts > $50B as estimated
-            if total and total > MAX_PLAUSIBLE_AMOUNT:
-                stats["monetary_capped"] += 1
-                is_estimated = True
-
-            mt = MonetaryTerms(
-                action_id=action.id,
-                total_amount=total,
-                civil_penalty=result.monetary_terms.civil_penalty,
-                consumer_restitution=result.monetary_terms.consumer_restitution,
-                fees_and_costs=result.monetary_terms.fees_and_costs,
-                amount_is_estimated=is_estimated,
-            )
-            session.add(mt)
-
-        # Step 5: Add violation categories
-        for vc in result.violation_categories:
-            session.add(ViolationCategory(
-                action_id=action.id,
-                category=vc.category,
-                subcategory=vc.subcategory,
-                confidence=vc.confidence,
-            ))
-
-        # Step 6: Add statutes
-        for sc in result.statutes_cited:
-            session.add(StatuteCited(
-                action_id=action.id,
-                statute_raw=sc.statute_raw,
-                statute_normalized=sc.statute_normalized,
-                statute_name=sc.statute_name,
-                is_state_statute=sc.is_state_statute,
-                is_federal_statute=sc.is_federal_statute,
-            ))
-
-        # Step 7: Add defendants with entity resolution
-        for d_schema in result.defendants:
-            canonical, confidence = resolver.resolve(d_schema.raw_name)
-            metadata = resolver.get_metadata(canonical)
-
-            if confidence >= 0.7:
-                stats["defendants_resolved"] += 1
-            else:
-                stats["defendants_new"] += 1
-
-            defendant = Defendant(
-                raw_name=d_schema.raw_name,
-                canonical_name=canonical,
-                entity_type=metadata.get("entity_type", "corporation"),
-                industry=metadata.get("industry"),
-                sec_cik=metadata.get("sec_cik"),
-            )
-            session.add(defendant)
-            session.flush()
-
-            session.add(ActionDefendant(
-                action_id=action.id,
-                defendant_id=defendant.id,
-                role="primary",
-            ))
-
-        session.commit()
+    action.action_type = result.action_type.value
+    action.status = result.status.value
+    action.summary = result.summary
+    action.is_multistate = result.is_multistate
+    action.quality_score = result.quality_score
+    action.extraction_method = result.extraction_method.value
+
+    if result.date_filed:
+        action.date_filed = result.date_filed
+    if result.date_resolved:
+        action.date_resolved = result.date_resolved
+
+    # Step 4: Add monetary terms (with sanity cap)
+    if result.monetary_terms:
+        total = result.monetary_terms.total_amount
+        is_estimated = result.monetary_terms.amount_is_estimated
+
+        # Sanity cap: flag amounts > $50B as estimated
+        if total and total > MAX_PLAUSIBLE_AMOUNT:
+            stats["monetary_capped"] += 1
+            is_estimated = True
+
+        mt = MonetaryTerms(
+            action_id=action.id,
+            total_amount=total,
+            civil_penalty=result.monetary_terms.civil_penalty,
+            consumer_restitution=result.monetary_terms.consumer_restitution,
+            fees_and_costs=result.monetary_terms.fees_and_costs,
+            amount_is_estimated=is_estimated,
+        )
+        session.add(mt)
+
+    # Step 5: Add violation categories. These rows are never read back in
+    # this transaction, so a Core executemany skips per-object ORM tracking.
+    vc_rows = [
+        {
+            "action_id": action.id,
+            "category": vc.category,
+            "subcategory": vc.subcategory,
+            "confidence": vc.confidence,
+        }
+        for vc in result.violation_categories
+    ]
+    if vc_rows:
+        session.execute(insert(ViolationCategory), vc_rows)
+
+    # Step 6: Add statutes
+    sc_rows = [
+        {
+            "action_id": action.id,
+            "statute_raw": sc.statute_raw,
+            "statute_normalized": sc.statute_normalized,
+            "statute_name": sc.statute_name,
+            "is_state_statute": sc.is_state_statute,
+            "is_federal_statute": sc.is_federal_statute,
+        }
+        for sc in result.statutes_cited
+    ]
+    if sc_rows:
+        session.execute(insert(StatuteCited), sc_rows)
+
+    # Step 7: Link defendants with entity resolution. A canonical name seen
+    # before reuses its Defendant row; new ones are flushed together once to
+    # populate their ids.
+    link_ids: dict[str, None] = {}  # ordered set of defendant ids to link
+    new_defendants: dict[str, Defendant] = {}
+    unnamed: list[Defendant] = []
+    for d_schema, canonical, confidence in resolved:
+        if confidence >= 0.7:
+            stats["defendants_resolved"] += 1
+        else:
+            stats["defendants_new"] += 1
+
+        if canonical in defendant_ids:
+            link_ids[defendant_ids[canonical]] = None
+            continue
+        if canonical in new_defendants:
+            continue
+
+        metadata = resolver.get_metadata(canonical)
+        defendant = Defendant(
+            raw_name=d_schema.raw_name,
+            canonical_name=canonical,
+            entity_type=metadata.get("entity_type", "corporation"),
+            industry=metadata.get("industry"),
+            sec_cik=metadata.get("sec_cik"),
+        )
+        # Rejected names resolve to "" and must not collapse into one row
+        if canonical:
+            new_defendants[canonical] = defendant
+        else:
+            unnamed.append(defendant)
+
+    created = [*new_defendants.values(), *unnamed]
+    if created:
+        session.add_all(created)
+        session.flush()
+        for canonical, defendant in new_defendants.items():
+            defendant_ids[canonical] = defendant.id
+        link_ids.update(dict.fromkeys(defendant.id for defendant in created))
+
+    session.add_all([
+        ActionDefendant(action_id=action.id, defendant_id=defendant_id, role="primary")
+        for defendant_id in link_ids
+    ])
 
     stats["extracted"] += 1
     if result.quality_score < 0.5:
@@ -18,6 +18,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import click
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from src.scrapers.registry import get_scraper, load_state_configs
 from src.storage.database import Database
@@ -33,6 +35,31 @@ logger = logging.getLogger("bulk_scrape")
 # States that are reachable for live scraping
 LIVE_STATES = ["california", "ohio", "texas", "oregon", "virginia", "washington"]
 
+# Scraped rows are inserted this many at a time, one transaction per batch
+STORE_BATCH_SIZE = 100
+
+# Detail pages in flight per state; the scraper's rate limit still spaces
+# out request starts, this just lets their responses overlap
+DETAIL_CONCURRENCY = 8
+
+
+def _store_batch(session: Session, state_code: str, batch: list[dict], stats: dict) -> None:
+    """Insert a batch of scraped press releases in a single transaction.
+
+    Runs without awaiting, so the SQLite write lock is never held while
+    other states' tasks run. A failed batch is rolled back, logged and
+    counted as errors rather than raised, so the rest of the state's
+    detail pages still get stored.
+    """
+    try:
+        session.execute(insert(EnforcementAction), batch)
+        session.commit()
+        stats["stored"] += len(batch)
+    except Exception as e:
+        session.rollback()
+        stats["errors"] += len(batch)
+        logger.warning("[%s] Failed to store %d records: %s", state_code, len(batch), e)
+
 
 async def scrape_state(
     state_key: str,
@@ -53,41 +80,53 @@ async def scrape_state(
         stats["listings"] = len(items)
         logger.info("[%s] Found %d listing items", scraper.state_code, len(items))
 
-        # Filter already-scraped URLs
-        new_items = [item for item in items if not db.action_exists(item.url)]
+        # Filter already-scraped URLs (and repeats within the listing, which
+        # would violate the source_url constraint inside one insert batch).
+        # source_url is unique across all states, so the check is global:
+        # one URL stored under another state would fail a whole batch.
+        unique_items = list({item.url: item for item in items}.values())
+        known_urls = db.existing_urls(item.url for item in unique_items)
+        new_items = [item for item in unique_items if item.url not in known_urls]
         stats["skipped"] = len(items) - len(new_items)
         if stats["skipped"]:
             logger.info("[%s] Skipping %d already-scraped URLs", scraper.state_code, stats["skipped"])
 
-        # Phase 2: Detail pages
-        for i, item in enumerate(new_items):
-            try:
-                pr = await scraper.scrape_detail(item)
-                stats["details"] += 1
-
-                # Store in database
-                if not db.action_exists(pr.url):
-                    with db.get_session() as session:
-                        action = EnforcementAction(
-                            state=pr.state,
-                            date_announced=pr.date or since,
-                            action_type="other",
-                            status="announced",
-                            headline=pr.title,
-                            source_url=pr.url,
-                            raw_text=pr.body_text[:10000] if pr.body_text else "",
-                        )
-                        session.add(action)
-                        session.commit()
-                        stats["stored"] += 1
-
-                if (i + 1) % 25 == 0:
-                    logger.info("[%s] Progress: %d/%d detail pages fetched, %d stored",
-                                scraper.state_code, i + 1, len(new_items), stats["stored"])
-
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning("[%s] Failed detail page %s: %s", scraper.state_code, item.url, e)
+        # Phase 2: Detail pages, fetched concurrently and stored in batches
+        sem = asyncio.Semaphore(DETAIL_CONCURRENCY)
+
+        async def fetch_detail(item):
+            async with sem:
+                return await scraper.scrape_detail(item)
+
+        # One writer session for the state, committed once per batch
+        with db.get_session() as session:
+            for start in range(0, len(new_items), STORE_BATCH_SIZE):
+                chunk = new_items[start:start + STORE_BATCH_SIZE]
+                results = await asyncio.gather(
+                    *(fetch_detail(item) for item in chunk), return_exceptions=True,
+                )
+
+                batch: list[dict] = []
+                for item, pr in zip(chunk, results, strict=True):
+                    if isinstance(pr, Exception):
+                        stats["errors"] += 1
+                        logger.warning("[%s] Failed detail page %s: %s", scraper.state_code, item.url, pr)
+                        continue
+                    stats["details"] += 1
+                    batch.append({
+                        "state": pr.state,
+                        "date_announced": pr.date or since,
+                        "action_type": "other",
+                        "status": "announced",
+                        "headline": pr.title,
+                        "source_url": pr.url,
+                        "raw_text": pr.body_text[:10000] if pr.body_text else "",
+                    })
+
+                if batch:
+                    _store_batch(session, scraper.state_code, batch, stats)
+                logger.info("[%s] Progress: %d/%d detail pages fetched, %d stored",
+                            scraper.state_code, start + len(chunk), len(new_items), stats["stored"])
 
         await scraper.close()
 
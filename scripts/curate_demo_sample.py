@@ -6,8 +6,11 @@ for a government affairs consultancy demo.
 
 import sqlite3
 import csv
+import hashlib
+import heapq
 import os
 import re
+from collections import Counter
 
 DB_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -18,6 +21,14 @@ OUTPUT_PATH = os.path.join(
     "data", "processed", "multistate_sample_data.csv"
 )
 
+# Read-side tuning for the raw connection: the GROUP BY below sorts in a
+# temp b-tree, and the whole file fits in the mmap window.
+SQLITE_PRAGMAS = (
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
 BASE_QUERY = """
 SELECT
     ea.id,
@@ -38,7 +49,10 @@ LEFT JOIN defendants d ON ad.defendant_id = d.id
 LEFT JOIN monetary_terms mt ON ea.id = mt.action_id
 LEFT JOIN violation_categories vc ON ea.id = vc.action_id
 WHERE ea.quality_score >= 0.5
+  -- score_record never picks sub-$500 settlements (monetary_terms is 1:1)
+  AND (mt.total_amount IS NULL OR NOT (mt.total_amount > 0 AND mt.total_amount < 500))
 GROUP BY ea.id
+HAVING defendants IS NOT NULL AND defendants <> ''
 """
 
 # Well-known defendant names to prioritize
@@ -61,6 +75,9 @@ PRIORITY_DEFENDANTS = [
     "Comcast", "Verizon", "Sprint",
     "Electron Hydro", "CenturyLink", "Enbridge",
 ]
+_PRIORITY_DEFENDANT_RE = re.compile(
+    "|".join(re.escape(name) for name in PRIORITY_DEFENDANTS), re.IGNORECASE
+)
 
 TARGET_STATES = ["CA", "NY", "WA", "TX", "MA", "OH", "OR"]
 
@@ -85,14 +102,38 @@ BAD_NAME_SIGNALS = [
     "Jeweler", "Ambulance Billing", "Requires The", "Defunding",
     "Others That Suspended", "Publicis Health",
 ]
+# One alternation for all signals; .match() anchors it like str.startswith
+_BAD_NAME_PREFIX_RE = re.compile("|".join(re.escape(s) for s in BAD_NAME_SIGNALS))
+
+# Trailing junk phrases stripped from defendant names
+_TRAILING_BY_RE = re.compile(r"\s+by\s+[A-Z].*$")
+_TRAILING_COUNTS_RE = re.compile(r"\s+of all counts.*$")
+
+# Headlines whose SimHash signatures differ in fewer bits than this are
+# treated as near-duplicates (same announcement, reworded or re-posted)
+NEAR_DUPLICATE_BITS = 6
+_HEADLINE_TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
 def get_all_records(conn):
+    """Load candidate records, caching the derived fields scoring reuses.
+
+    Clean defendants, capped categories, the headline signature, the
+    announcement date as a YYYYMMDD int and the priority-defendant flag
+    are pure functions of the record's strings but are read in every
+    selection round, so they are computed once here and stored under "_"
+    keys.
+    """
     cursor = conn.execute(BASE_QUERY)
-    columns = [desc[0] for desc in cursor.description]
+    columns = tuple(desc[0] for desc in cursor.description)
     rows = []
-    for row in cursor.fetchall():
+    for row in cursor:
         record = dict(zip(columns, row))
+        record["_clean_defs"] = _compute_clean_defendants(record)
+        record["_cats"] = _compute_categories(record)
+        record["_sig"] = headline_simhash(clean_headline(record.get("headline") or ""))
+        record["_date_int"] = date_to_int(record.get("date_announced"))
+        record["_priority"] = has_priority_defendant(record)
         rows.append(record)
     return rows
 
@@ -102,9 +143,8 @@ def clean_name(name):
     name = name.strip()
     if len(name) < 3 or len(name) > 70:
         return None
-    for signal in BAD_NAME_SIGNALS:
-        if name.startswith(signal):
-            return None
+    if _BAD_NAME_PREFIX_RE.match(name):
+        return None
     # Reject names that are all lowercase (likely sentence fragments)
     if name == name.lower() and len(name) > 15:
         return None
@@ -112,17 +152,15 @@ def clean_name(name):
     if name.count(" ") > 6:
         return None
     # Remove trailing junk phrases
-    import re as _re
-    name = _re.sub(r"\s+by\s+[A-Z].*$", "", name)
-    name = _re.sub(r"\s+of all counts.*$", "", name)
+    name = _TRAILING_BY_RE.sub("", name)
+    name = _TRAILING_COUNTS_RE.sub("", name)
     name = name.strip()
     if len(name) < 3:
         return None
     return name
 
 
-def get_clean_defendants(record):
-    """Return list of clean defendant names from a record."""
+def _compute_clean_defendants(record):
     defs_str = record.get("defendants") or ""
     if not defs_str:
         return []
@@ -131,6 +169,11 @@ def get_clean_defendants(record):
     return [c for c in clean if c is not None]
 
 
+def get_clean_defendants(record):
+    """Return list of clean defendant names from a record."""
+    return record["_clean_defs"]
+
+
 def has_clean_defendant(record):
     return len(get_clean_defendants(record)) > 0
 
@@ -152,6 +195,38 @@ def clean_headline(headline):
     return headline
 
 
+def headline_simhash(headline):
+    """64-bit SimHash of a headline's distinct word tokens.
+
+    Each token's hash votes on every bit; a signature bit is set when most
+    tokens have it set, so headlines sharing most of their words land a few
+    bits apart regardless of where the wording differs.
+    """
+    tokens = set(_HEADLINE_TOKEN_RE.findall(headline.lower()))
+    rows = [
+        format(int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "big"), "064b")
+        for t in tokens
+    ]
+    signature = 0
+    for column in zip(*rows, strict=True):  # most significant bit first
+        signature = signature << 1 | (2 * column.count("1") > len(rows))
+    return signature
+
+
+def is_near_duplicate(signature, selected_signatures):
+    return any(
+        (signature ^ other).bit_count() < NEAR_DUPLICATE_BITS
+        for other in selected_signatures
+    )
+
+
+def date_to_int(iso_date):
+    """Turn an ISO "YYYY-MM-DD" string into YYYYMMDD for integer comparison (0 if missing)."""
+    if not iso_date or len(iso_date) < 10:
+        return 0
+    return int(iso_date[:4] + iso_date[5:7] + iso_date[8:10])
+
+
 def format_amount(amount):
     if amount is None or amount == 0:
         return ""
@@ -177,32 +252,35 @@ def get_amount_bucket(amount):
         return "none"
 
 
-def get_categories(record):
-    """Get violation categories, capped at 3 for readability."""
+# Prioritize the most specific/interesting categories
+CATEGORY_PRIORITY = [
+    "data_privacy", "antitrust", "environmental", "healthcare",
+    "tech_platform", "securities", "tobacco_vaping", "employment",
+    "housing_lending", "telecommunications", "charitable",
+    "consumer_protection", "other"
+]
+_CATEGORY_RANK = {cat: i for i, cat in enumerate(CATEGORY_PRIORITY)}
+
+
+def _compute_categories(record):
     cats_str = record.get("violation_categories") or ""
     cats = [c.strip() for c in cats_str.split(",") if c.strip()]
-    # Prioritize the most specific/interesting categories
-    priority_order = [
-        "data_privacy", "antitrust", "environmental", "healthcare",
-        "tech_platform", "securities", "tobacco_vaping", "employment",
-        "housing_lending", "telecommunications", "charitable",
-        "consumer_protection", "other"
-    ]
-    cats_sorted = sorted(cats, key=lambda c: priority_order.index(c) if c in priority_order else 99)
+    cats_sorted = sorted(cats, key=lambda c: _CATEGORY_RANK.get(c, 99))
     return cats_sorted[:3]  # Cap at 3 categories
 
 
+def get_categories(record):
+    """Get violation categories, capped at 3 for readability."""
+    return record["_cats"]
+
+
 def has_priority_defendant(record):
-    defs = (record.get("defendants") or "").lower()
-    for pd_name in PRIORITY_DEFENDANTS:
-        if pd_name.lower() in defs:
-            return True
-    return False
+    return _PRIORITY_DEFENDANT_RE.search(record.get("defendants") or "") is not None
 
 
 def score_record(record, selected_ids, state_counts, category_counts,
                  action_type_counts, amount_bucket_counts, multistate_count,
-                 selected_headline_keys):
+                 selected_signatures):
     """Score a record for selection priority."""
     if record["id"] in selected_ids:
         return -100
@@ -211,12 +289,11 @@ def score_record(record, selected_ids, state_counts, category_counts,
         return -100
     
     # Near-duplicate check
-    hl_key = clean_headline(record.get("headline") or "")[:50].lower().strip()
-    if hl_key in selected_headline_keys:
+    if is_near_duplicate(record["_sig"], selected_signatures):
         return -100
     
     # Reject records with very low settlement amounts (under $500) — not demo-worthy
-    amount = record.get("total_amount")
+    amount = record["total_amount"]
     if amount and 0 < float(amount) < 500:
         return -100
     
@@ -225,7 +302,7 @@ def score_record(record, selected_ids, state_counts, category_counts,
     score += 3  # Base score for having clean defendant
     
     # Priority defendant bonus
-    if has_priority_defendant(record):
+    if record["_priority"]:
         score += 5
     
     # State diversity — strict balancing
@@ -289,12 +366,12 @@ def score_record(record, selected_ids, state_counts, category_counts,
             score += 3
     
     # Recency bonus
-    date = record.get("date_announced") or ""
-    if date >= "2024-01-01":
+    date = record["_date_int"]
+    if date >= 20240101:
         score += 2
-    elif date >= "2022-01-01":
+    elif date >= 20220101:
         score += 1
-    elif date >= "2018-01-01":
+    elif date >= 20180101:
         score += 0
     else:
         score -= 3
@@ -303,6 +380,16 @@ def score_record(record, selected_ids, state_counts, category_counts,
 
 
 def select_records(all_records, target_count=65):
+    """Greedily pick the highest-scoring record each round.
+
+    Every score_record term either ignores the selection so far or shrinks
+    as its counter grows, so a record's score never rises between rounds.
+    That allows lazy evaluation: candidates sit in a max-heap keyed by their
+    last computed score, and only the top entry is re-scored — if its score
+    is unchanged it beats every other candidate's (stale, upper-bound)
+    score, otherwise it is pushed back with the new one. Ties go to the
+    earlier candidate, as in a full rescan.
+    """
     selected = []
     selected_ids = set()
     state_counts = {}
@@ -310,24 +397,34 @@ def select_records(all_records, target_count=65):
     action_type_counts = {}
     amount_bucket_counts = {}
     multistate_count = 0
-    selected_headline_keys = set()
+    selected_signatures = []
     
     candidates = [r for r in all_records if has_clean_defendant(r)]
     print(f"Total qualifying records with clean defendants: {len(candidates)}")
+
+    def current_score(record):
+        return score_record(
+            record, selected_ids, state_counts, category_counts,
+            action_type_counts, amount_bucket_counts, multistate_count,
+            selected_signatures
+        )
+
+    heap = [(-current_score(record), idx) for idx, record in enumerate(candidates)]
+    heapq.heapify(heap)
     
     for round_num in range(target_count):
         best_score = -999
         best_record = None
         
-        for record in candidates:
-            score = score_record(
-                record, selected_ids, state_counts, category_counts,
-                action_type_counts, amount_bucket_counts, multistate_count,
-                selected_headline_keys
-            )
-            if score > best_score:
+        while heap:
+            neg_score, idx = heap[0]
+            score = current_score(candidates[idx])
+            if score == -neg_score:
+                heapq.heappop(heap)
                 best_score = score
-                best_record = record
+                best_record = candidates[idx]
+                break
+            heapq.heapreplace(heap, (-score, idx))
         
         if best_record is None or best_score <= -100:
             print(f"  Stopped at round {round_num} (best score: {best_score})")
@@ -351,8 +448,7 @@ def select_records(all_records, target_count=65):
         if best_record["is_multistate"]:
             multistate_count += 1
         
-        hl_key = clean_headline(best_record.get("headline") or "")[:50].lower().strip()
-        selected_headline_keys.add(hl_key)
+        selected_signatures.append(best_record["_sig"])
     
     return selected
 
@@ -391,51 +487,49 @@ def write_csv(records, output_path):
 def print_summary(records):
     print(f"\n=== SELECTION SUMMARY ({len(records)} records) ===\n")
     
-    state_counts = {}
+    # Tally everything in one pass over the selection
+    state_counts = Counter()
+    cat_counts = Counter()
+    at_counts = Counter()
+    bucket_counts = Counter()
+    ms_count = 0
+    dates = []
     for r in records:
-        s = r["state"]
-        state_counts[s] = state_counts.get(s, 0) + 1
+        state_counts[r["state"]] += 1
+        cat_counts.update(get_categories(r))
+        at_counts[r["action_type"]] += 1
+        bucket_counts[get_amount_bucket(r.get("total_amount"))] += 1
+        if r.get("is_multistate"):
+            ms_count += 1
+        if r.get("date_announced"):
+            dates.append(r["date_announced"])
+    
     print("By state:")
     for s, c in sorted(state_counts.items(), key=lambda x: -x[1]):
         print(f"  {s}: {c}")
     
-    cat_counts = {}
-    for r in records:
-        for cat in get_categories(r):
-            cat_counts[cat] = cat_counts.get(cat, 0) + 1
     print("\nBy violation category (capped at 3 per record):")
     for c, cnt in sorted(cat_counts.items(), key=lambda x: -x[1]):
         print(f"  {c}: {cnt}")
     
-    at_counts = {}
-    for r in records:
-        at = r["action_type"]
-        at_counts[at] = at_counts.get(at, 0) + 1
     print("\nBy action type:")
     for at, cnt in sorted(at_counts.items(), key=lambda x: -x[1]):
         print(f"  {at}: {cnt}")
     
-    buckets = {"large (>$100M)": 0, "mid ($1M-$100M)": 0, "small (<$1M)": 0, "none": 0}
-    for r in records:
-        amount = r.get("total_amount")
-        if amount and float(amount) > 100_000_000:
-            buckets["large (>$100M)"] += 1
-        elif amount and float(amount) >= 1_000_000:
-            buckets["mid ($1M-$100M)"] += 1
-        elif amount and float(amount) > 0:
-            buckets["small (<$1M)"] += 1
-        else:
-            buckets["none"] += 1
+    bucket_labels = {
+        "large": "large (>$100M)",
+        "mid": "mid ($1M-$100M)",
+        "small": "small (<$1M)",
+        "none": "none",
+    }
     print("\nBy settlement size:")
-    for b, cnt in buckets.items():
-        print(f"  {b}: {cnt}")
+    for b, label in bucket_labels.items():
+        print(f"  {label}: {bucket_counts[b]}")
     
-    ms_count = sum(1 for r in records if r.get("is_multistate"))
     print(f"\nMultistate actions: {ms_count}")
     
-    dates = sorted([r.get("date_announced") or "" for r in records if r.get("date_announced")])
     if dates:
-        print(f"Date range: {dates[0]} to {dates[-1]}")
+        print(f"Date range: {min(dates)} to {max(dates)}")
     
     print("\nNotable defendants:")
     seen = set()
@@ -453,8 +547,10 @@ def main():
     print(f"Output:   {OUTPUT_PATH}")
     
     conn = sqlite3.connect(DB_PATH)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
     all_records = get_all_records(conn)
-    print(f"Total records in database (quality >= 0.5): {len(all_records)}")
+    print(f"Candidate records (quality >= 0.5, with defendants): {len(all_records)}")
     
     selected = select_records(all_records, target_count=65)
     print_summary(selected)
@@ -7,8 +7,11 @@ from __future__ import annotations
 
 import csv
 import io
+import itertools
 import json
+import operator
 import sys
+from collections.abc import Iterable, Iterator
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -18,8 +21,12 @@ from rich.console import Console
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder is used without it
+    orjson = None
 from sqlalchemy import select, desc
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from src.storage.database import Database
 from src.storage.models import (
@@ -43,27 +50,56 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def load_actions(db: Database, state: str | None = None, since: date | None = None) -> list[dict]:
-    """Load all enforcement actions with related data, returned as flat dicts."""
+def _orjson_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_row(row: dict) -> bytes:
+    """Serialize one export row as 2-space indented JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_INDENT_2, default=_orjson_default)
+    return json.dumps(row, indent=2, cls=DecimalEncoder).encode("utf-8")
+
+
+# Actions fetched (and related rows eager-loaded) per round trip while streaming
+EXPORT_BATCH_SIZE = 500
+
+# Output file buffer; rows are written one at a time, so a large buffer
+# keeps write() syscalls down on multi-MB exports
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def load_actions(db: Database, state: str | None = None, since: date | None = None) -> Iterator[dict]:
+    """Stream all enforcement actions with related data as flat dicts.
+
+    Actions are fetched EXPORT_BATCH_SIZE at a time, with each batch's
+    related rows loaded by one IN query per relationship, so memory stays
+    flat regardless of table size. The session stays open until the
+    iterator is exhausted or closed.
+    """
     with db.get_session() as session:
         stmt = (
             select(EnforcementAction)
             .options(
-                joinedload(EnforcementAction.action_defendants).joinedload(ActionDefendant.defendant),
-                joinedload(EnforcementAction.violation_categories),
-                joinedload(EnforcementAction.monetary_terms),
-                joinedload(EnforcementAction.statutes_cited),
+                selectinload(EnforcementAction.action_defendants).selectinload(ActionDefendant.defendant),
+                selectinload(EnforcementAction.violation_categories),
+                selectinload(EnforcementAction.monetary_terms),
+                selectinload(EnforcementAction.statutes_cited),
             )
-            .order_by(desc(EnforcementAction.date_announced))
+            # id breaks date ties so the output order doesn't depend on the query plan
+            .order_by(desc(EnforcementAction.date_announced), EnforcementAction.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
         )
         if state:
             stmt = stmt.where(EnforcementAction.state == state.upper())
         if since:
             stmt = stmt.where(EnforcementAction.date_announced >= since)
 
-        actions = session.execute(stmt).unique().scalars().all()
         # Convert to dicts inside the session to avoid DetachedInstanceError
-        return [action_to_row(a) for a in actions]
+        for action in session.execute(stmt).scalars():
+            yield action_to_row(action)
 
 
 def action_to_row(a: EnforcementAction) -> dict:
@@ -100,34 +136,58 @@ def action_to_row(a: EnforcementAction) -> dict:
     }
 
 
-def export_csv(rows: list[dict], output_path: Path):
-    """Export to CSV."""
-    if not rows:
+def export_csv(rows: Iterable[dict], output_path: Path):
+    """Export to CSV, writing rows as they arrive."""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
         console.print("[yellow]No actions to export.[/yellow]")
         return
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
+    # Every row has the same keys, so pull values positionally rather than
+    # paying DictWriter's per-row field checks
+    fieldnames = list(first)
+    values = operator.itemgetter(*fieldnames)
+
+    count = 1
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerow(values(first))
+        for row in rows:
+            writer.writerow(values(row))
+            count += 1
 
-    console.print(f"Exported [green]{len(rows)}[/green] actions to [cyan]{output_path}[/cyan]")
+    console.print(f"Exported [green]{count}[/green] actions to [cyan]{output_path}[/cyan]")
 
 
-def export_json(rows: list[dict], output_path: Path):
-    """Export to JSON."""
-    if not rows:
+def export_json(rows: Iterable[dict], output_path: Path):
+    """Export to JSON, writing rows as they arrive.
+
+    The total isn't known until the stream ends, so "count" follows the
+    "actions" array; otherwise the layout matches ``json.dump(indent=2)``.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
         console.print("[yellow]No actions to export.[/yellow]")
         return
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump({"count": len(rows), "actions": rows}, f, indent=2, cls=DecimalEncoder)
-
-    console.print(f"Exported [green]{len(rows)}[/green] actions to [cyan]{output_path}[/cyan]")
+    count = 0
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b'{\n  "actions": [\n')
+        for row in itertools.chain([first], rows):
+            if count:
+                f.write(b",\n")
+            f.write(b"    " + _encode_row(row).replace(b"\n", b"\n    "))
+            count += 1
+        f.write(b'\n  ],\n  "count": %d\n}' % count)
+
+    console.print(f"Exported [green]{count}[/green] actions to [cyan]{output_path}[/cyan]")
 
 
 @click.command()
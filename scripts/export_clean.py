@@ -13,6 +13,7 @@ from __future__ import annotations
 import csv
 import os
 import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -49,6 +50,10 @@ ACTION_TYPE_DISPLAY = {
     "other": "Other",
 }
 
+# Output file buffer; rows are written one at a time, so a large buffer
+# keeps write() syscalls down on multi-MB exports
+WRITE_BUFFER_SIZE = 1 << 20
+
 COLUMNS = [
     "State",
     "Date",
@@ -61,120 +66,89 @@ COLUMNS = [
     "Source URL",
 ]
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
+# Read-side tuning for the raw connection: the export is one pass of index
+# probes across five tables, so keep pages cached and the file memory-mapped.
+# Journal settings are left to the pipeline's own connections.
+SQLITE_PRAGMAS = (
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-131072",
+)
+
+# Mirrors the index declared on EnforcementAction so databases created before
+# it existed get it too; lets the export read rows in date order without a sort.
+EXPORT_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS ix_enforcement_actions_federal_date
+ON enforcement_actions (is_federal_litigation, date_announced, quality_score)
+"""
 
 
-def fetch_actions(conn: sqlite3.Connection) -> list[dict]:
-    """Fetch enforcement actions with quality_score >= 0.5, sorted by date descending."""
-    cur = conn.execute(
-        """
-        SELECT id, state, date_announced, headline, action_type, source_url
-        FROM enforcement_actions
-        WHERE quality_score >= 0.5
-          AND is_federal_litigation = 0
-        ORDER BY date_announced DESC
-        """
-    )
-    actions = []
-    for row in cur.fetchall():
-        actions.append({
-            "id": row[0],
-            "state": row[1],
-            "date_announced": row[2],
-            "headline": row[3],
-            "action_type": row[4],
-            "source_url": row[5],
-        })
-    return actions
-
-
-def fetch_defendants(conn: sqlite3.Connection) -> dict[str, list[str]]:
-    """Return a mapping of action_id -> list of canonical defendant names."""
-    cur = conn.execute(
-        """
-        SELECT ad.action_id, d.canonical_name
-        FROM action_defendants ad
-        JOIN defendants d ON d.id = ad.defendant_id
-        ORDER BY ad.action_id, d.canonical_name
-        """
-    )
-    result: dict[str, list[str]] = {}
-    for action_id, canonical_name in cur.fetchall():
-        result.setdefault(action_id, []).append(canonical_name)
-    return result
-
-
-def fetch_categories(conn: sqlite3.Connection) -> dict[str, list[str]]:
-    """Return a mapping of action_id -> list of category keys."""
-    cur = conn.execute(
-        """
-        SELECT action_id, category
-        FROM violation_categories
-        ORDER BY action_id, category
-        """
-    )
-    result: dict[str, list[str]] = {}
-    for action_id, category in cur.fetchall():
-        result.setdefault(action_id, []).append(category)
-    return result
-
-
-def fetch_monetary_terms(conn: sqlite3.Connection) -> dict[str, float]:
-    """Return a mapping of action_id -> total_amount."""
-    cur = conn.execute(
-        """
-        SELECT action_id, total_amount
-        FROM monetary_terms
-        """
+def _display_case(column: str, mapping: dict[str, str]) -> str:
+    """Build a SQL CASE mapping internal keys in ``column`` to display names.
+
+    Keys missing from ``mapping`` pass through unchanged.
+    """
+    whens = " ".join(
+        "WHEN '{}' THEN '{}'".format(key, display.replace("'", "''"))
+        for key, display in mapping.items()
     )
-    return {row[0]: row[1] for row in cur.fetchall()}
+    return f"CASE {column} {whens} ELSE {column} END"
+
+
+# Columns follow COLUMNS. Defendants, categories, settlement amount and
+# statutes are assembled per action by correlated subqueries, so each row
+# arrives ready to write.
+# Action types and categories are mapped to display names in SQL, and every
+# list cell is pre-joined with '; '. Each category key has its own display
+# name, so DISTINCT on keys also de-duplicates the displayed names.
+EXPORT_QUERY = f"""
+SELECT ea.state, ea.date_announced, ea.headline,
+       (SELECT GROUP_CONCAT(name, '; ') FROM (
+            SELECT d.canonical_name AS name
+            FROM action_defendants ad
+            JOIN defendants d ON d.id = ad.defendant_id
+            WHERE ad.action_id = ea.id
+            ORDER BY d.canonical_name)) AS defendants,
+       {_display_case("ea.action_type", ACTION_TYPE_DISPLAY)} AS action_type,
+       (SELECT GROUP_CONCAT({_display_case("category", CATEGORY_DISPLAY)}, '; ') FROM (
+            SELECT DISTINCT category FROM violation_categories
+            WHERE action_id = ea.id
+            ORDER BY category)) AS categories,
+       (SELECT total_amount FROM monetary_terms
+        WHERE action_id = ea.id) AS total_amount,
+       (SELECT GROUP_CONCAT(statute_raw, '; ') FROM (
+            SELECT statute_raw FROM statutes_cited
+            WHERE action_id = ea.id
+            ORDER BY statute_raw)) AS statutes,
+       ea.source_url
+FROM enforcement_actions ea
+WHERE ea.quality_score >= 0.5
+  AND ea.is_federal_litigation = 0
+ORDER BY ea.date_announced DESC
+"""
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
 
-def fetch_statutes(conn: sqlite3.Connection) -> dict[str, list[str]]:
-    """Return a mapping of action_id -> list of raw statute citations."""
-    cur = conn.execute(
-        """
-        SELECT action_id, statute_raw
-        FROM statutes_cited
-        ORDER BY action_id, statute_raw
-        """
-    )
-    result: dict[str, list[str]] = {}
-    for action_id, statute_raw in cur.fetchall():
-        result.setdefault(action_id, []).append(statute_raw)
-    return result
+
+def fetch_actions(conn: sqlite3.Connection) -> Iterator[tuple]:
+    """Yield enforcement actions with quality_score >= 0.5, sorted by date descending."""
+    yield from conn.execute(EXPORT_QUERY)
 
 
-def format_amount(amount: float | None) -> str:
+def format_amount(amount: int | float | None) -> str:
     """Format a dollar amount as a plain number string, or empty if None."""
-    if amount is None or amount == 0:
+    if not amount:
         return ""
-    # Remove trailing zeros after decimal; show as integer if whole number
-    if amount == int(amount):
+    # SQLite returns whole amounts as int; show floats as integer if whole
+    if type(amount) is int:
+        return str(amount)
+    if amount.is_integer():
         return str(int(amount))
     return f"{amount:.2f}"
 
 
-def format_action_type(raw: str) -> str:
-    """Map internal action_type key to display name."""
-    return ACTION_TYPE_DISPLAY.get(raw, raw.replace("_", " ").title())
-
-
-def format_categories(cats: list[str]) -> str:
-    """Map internal category keys to display names and join with '; '."""
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    display_names: list[str] = []
-    for cat in cats:
-        display = CATEGORY_DISPLAY.get(cat, cat.replace("_", " ").title())
-        if display not in seen:
-            seen.add(display)
-            display_names.append(display)
-    return "; ".join(display_names)
-
-
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -186,41 +160,29 @@ def main() -> None:
         raise SystemExit(1)
 
     conn = sqlite3.connect(str(DB_PATH))
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    conn.execute(EXPORT_INDEX_DDL)
+    count = 0
     try:
-        # Fetch all data
-        actions = fetch_actions(conn)
-        defendants_map = fetch_defendants(conn)
-        categories_map = fetch_categories(conn)
-        monetary_map = fetch_monetary_terms(conn)
-        statutes_map = fetch_statutes(conn)
+        OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(
+            OUTPUT_PATH, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE,
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            for (state, date_announced, headline, defendants, action_type,
+                 categories, amount, statutes, source_url) in fetch_actions(conn):
+                # csv.writer writes None as an empty cell
+                writer.writerow((
+                    state, date_announced, headline, defendants, action_type,
+                    categories, format_amount(amount), statutes, source_url,
+                ))
+                count += 1
     finally:
         conn.close()
 
-    # Build rows
-    rows: list[dict[str, str]] = []
-    for action in actions:
-        aid = action["id"]
-        row = {
-            "State": action["state"] or "",
-            "Date": action["date_announced"] or "",
-            "Headline": action["headline"] or "",
-            "Defendant": "; ".join(defendants_map.get(aid, [])),
-            "Action Type": format_action_type(action["action_type"]),
-            "Violation Category": format_categories(categories_map.get(aid, [])),
-            "Settlement Amount": format_amount(monetary_map.get(aid)),
-            "Statute Cited": "; ".join(statutes_map.get(aid, [])),
-            "Source URL": action["source_url"] or "",
-        }
-        rows.append(row)
-
-    # Write CSV
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_PATH, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"Exported {len(rows)} rows to {OUTPUT_PATH}")
+    print(f"Exported {count} rows to {OUTPUT_PATH}")
 
 
 if __name__ == "__main__":
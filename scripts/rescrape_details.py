@@ -22,12 +22,19 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import click
 import httpx
 from selectolax.parser import HTMLParser
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
 
 from src.scrapers.base import BaseScraper
 from src.scrapers.registry import get_scraper, load_state_configs
 from src.storage.database import Database
-from src.storage.models import EnforcementAction
+from src.storage.models import (
+    ActionDefendant,
+    EnforcementAction,
+    MonetaryTerms,
+    StatuteCited,
+    ViolationCategory,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +45,82 @@ logger = logging.getLogger("rescrape")
 
 USER_AGENT = "AGEnforcementTracker/1.0 (research project; contact@example.com)"
 
+# Rows written per transaction when storing re-scraped pages
+WRITE_BATCH_SIZE = 200
+
+# Corrected body container for TX detail pages
+TX_BODY_SELECTOR = ".main-content-wysiwyg-container"
+
+# TX detail pages in flight at once; the scraper's rate limit still spaces
+# out request starts, this just lets their responses overlap
+DETAIL_CONCURRENCY = 8
+
+
+def _delete_state_actions(session: Session, state: str) -> int:
+    """Bulk-delete a state's actions and their child rows; return actions deleted.
+
+    Core DELETEs skip the ORM delete-orphan cascade, so the child tables
+    are cleared explicitly first.
+    """
+    action_ids = select(EnforcementAction.id).where(EnforcementAction.state == state)
+    for child in (ActionDefendant, ViolationCategory, MonetaryTerms, StatuteCited):
+        session.execute(delete(child).where(child.action_id.in_(action_ids)))
+    result = session.execute(delete(EnforcementAction).where(EnforcementAction.state == state))
+    return result.rowcount
+
+
+def _flush_updates(db: Database, pending: list[dict], stats: dict) -> None:
+    """Apply queued per-action updates in one transaction and clear the queue.
+
+    A failed batch is logged and counted as errors rather than raised, so
+    the remaining pages still get written.
+    """
+    if not pending:
+        return
+    try:
+        with db.get_session() as session:
+            session.execute(update(EnforcementAction), pending)
+            session.commit()
+        stats["updated"] += len(pending)
+    except Exception as e:
+        stats["errors"] += len(pending)
+        logger.warning("[%s] Failed to update batch of %d: %s", stats["state"], len(pending), e)
+    pending.clear()
+
+
+def _flush_inserts(db: Database, pending: list[EnforcementAction], stats: dict) -> None:
+    """Insert queued new actions in one transaction and clear the queue.
+
+    Failures are handled as in _flush_updates.
+    """
+    if not pending:
+        return
+    try:
+        with db.get_session() as session:
+            session.add_all(pending)
+            session.commit()
+        stats["stored"] += len(pending)
+    except Exception as e:
+        stats["errors"] += len(pending)
+        logger.warning("[%s] Failed to store batch of %d: %s", stats["state"], len(pending), e)
+    pending.clear()
+
+
+def _parse_tx_page(html: str, scraper: BaseScraper) -> tuple[str, date | None] | None:
+    """Return a TX detail page's body text and announced date.
+
+    Returns None when the corrected body selector finds no usable text.
+    """
+    tree = HTMLParser(html)
+    body_node = tree.css_first(TX_BODY_SELECTOR)
+    if not body_node:
+        return None
+    body_text = body_node.text(separator="\n", strip=True)
+    if not body_text or len(body_text) <= 50:
+        return None
+    # Extract date from body text
+    return body_text, scraper._extract_date_from_detail(tree, body_text)
+
 
 async def rescrape_tx(db: Database) -> dict:
     """Re-fetch TX detail pages and update body text with corrected selector."""
@@ -53,43 +136,43 @@ async def rescrape_tx(db: Database) -> dict:
     logger.info("[TX] Found %d real records to re-scrape (excluding fixtures)", stats["total"])
 
     scraper = get_scraper("texas")
-    body_sel = ".main-content-wysiwyg-container"
+    sem = asyncio.Semaphore(DETAIL_CONCURRENCY)
 
-    for i, (action_id, source_url) in enumerate(actions):
-        try:
+    async def refetch(action_id: str, source_url: str) -> dict | None:
+        """Fetch one page and return its update, or None if the body is empty."""
+        async with sem:
             html = await scraper.fetch(source_url)
-            tree = HTMLParser(html)
-
-            body_node = tree.css_first(body_sel)
-            if body_node:
-                body_text = body_node.text(separator="\n", strip=True)
-                if body_text and len(body_text) > 50:
-                    # Extract date from body text
-                    pr_date = scraper._extract_date_from_detail(tree, body_text)
-
-                    with db.get_session() as session:
-                        updates = {"raw_text": body_text[:10000]}
-                        if pr_date:
-                            updates["date_announced"] = pr_date
-                        session.execute(
-                            update(EnforcementAction)
-                            .where(EnforcementAction.id == action_id)
-                            .values(**updates)
-                        )
-                        session.commit()
-                        stats["updated"] += 1
-                else:
-                    stats["empty"] += 1
-            else:
+        # Parse in a worker thread so the event loop keeps driving other fetches
+        parsed = await asyncio.to_thread(_parse_tx_page, html, scraper)
+        if parsed is None:
+            return None
+
+        body_text, pr_date = parsed
+        updates = {"id": action_id, "raw_text": body_text[:10000]}
+        if pr_date:
+            updates["date_announced"] = pr_date
+        return updates
+
+    for start in range(0, len(actions), WRITE_BATCH_SIZE):
+        chunk = actions[start:start + WRITE_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(refetch(action_id, source_url) for action_id, source_url in chunk),
+            return_exceptions=True,
+        )
+
+        pending: list[dict] = []
+        for (_, source_url), result in zip(chunk, results, strict=True):
+            if isinstance(result, Exception):
+                stats["errors"] += 1
+                logger.warning("[TX] Error re-scraping %s: %s", source_url, result)
+            elif result is None:
                 stats["empty"] += 1
+            else:
+                pending.append(result)
+        _flush_updates(db, pending, stats)
 
-            if (i + 1) % 50 == 0:
-                logger.info("[TX] Progress: %d/%d, %d updated",
-                            i + 1, stats["total"], stats["updated"])
-
-        except Exception as e:
-            stats["errors"] += 1
-            logger.warning("[TX] Error re-scraping %s: %s", source_url, e)
+        logger.info("[TX] Progress: %d/%d, %d updated",
+                    start + len(chunk), stats["total"], stats["updated"])
 
     await scraper.close()
     return stats
@@ -103,17 +186,8 @@ async def rescrape_or(db: Database, since: date) -> dict:
     stats = {"state": "OR", "old_count": 0, "deleted": 0, "new_found": 0, "stored": 0, "errors": 0}
 
     with db.get_session() as session:
-        old_count = session.execute(
-            select(EnforcementAction.id).where(EnforcementAction.state == "OR")
-        ).all()
-        stats["old_count"] = len(old_count)
-
         # Delete old OR records (URLs are dead)
-        for (action_id,) in old_count:
-            action = session.get(EnforcementAction, action_id)
-            if action:
-                session.delete(action)
-                stats["deleted"] += 1
+        stats["old_count"] = stats["deleted"] = _delete_state_actions(session, "OR")
         session.commit()
     logger.info("[OR] Deleted %d old records with dead URLs", stats["deleted"])
 
@@ -122,21 +196,24 @@ async def rescrape_or(db: Database, since: date) -> dict:
     press_releases = await scraper.scrape(since=since, max_pages=200)
     stats["new_found"] = len(press_releases)
 
+    pending: list[EnforcementAction] = []
+    # Also holds URLs queued this run, since the listing can repeat one
+    existing = db.existing_urls(pr.url for pr in press_releases)
     for pr in press_releases:
-        if not db.action_exists(pr.url):
-            with db.get_session() as session:
-                action = EnforcementAction(
-                    state="OR",
-                    date_announced=pr.date or since,
-                    action_type="other",
-                    status="announced",
-                    headline=pr.title,
-                    source_url=pr.url,
-                    raw_text=pr.body_text[:10000] if pr.body_text else "",
-                )
-                session.add(action)
-                session.commit()
-                stats["stored"] += 1
+        if pr.url not in existing:
+            existing.add(pr.url)
+            pending.append(EnforcementAction(
+                state="OR",
+                date_announced=pr.date or since,
+                action_type="other",
+                status="announced",
+                headline=pr.title,
+                source_url=pr.url,
+                raw_text=pr.body_text[:10000] if pr.body_text else "",
+            ))
+            if len(pending) >= WRITE_BATCH_SIZE:
+                _flush_inserts(db, pending, stats)
+    _flush_inserts(db, pending, stats)
 
     await scraper.close()
     return stats
@@ -150,16 +227,7 @@ async def rescrape_va(db: Database, since: date) -> dict:
     stats = {"state": "VA", "old_count": 0, "deleted": 0, "new_found": 0, "stored": 0, "errors": 0}
 
     with db.get_session() as session:
-        old_count = session.execute(
-            select(EnforcementAction.id).where(EnforcementAction.state == "VA")
-        ).all()
-        stats["old_count"] = len(old_count)
-
-        for (action_id,) in old_count:
-            action = session.get(EnforcementAction, action_id)
-            if action:
-                session.delete(action)
-                stats["deleted"] += 1
+        stats["old_count"] = stats["deleted"] = _delete_state_actions(session, "VA")
         session.commit()
     logger.info("[VA] Deleted %d old records with dead URLs", stats["deleted"])
 
@@ -168,21 +236,24 @@ async def rescrape_va(db: Database, since: date) -> dict:
     press_releases = await scraper.scrape(since=since, max_pages=200)
     stats["new_found"] = len(press_releases)
 
+    pending: list[EnforcementAction] = []
+    # Also holds URLs queued this run, since the listing can repeat one
+    existing = db.existing_urls(pr.url for pr in press_releases)
     for pr in press_releases:
-        if not db.action_exists(pr.url):
-            with db.get_session() as session:
-                action = EnforcementAction(
-                    state="VA",
-                    date_announced=pr.date or since,
-                    action_type="other",
-                    status="announced",
-                    headline=pr.title,
-                    source_url=pr.url,
-                    raw_text=pr.body_text[:10000] if pr.body_text else "",
-                )
-                session.add(action)
-                session.commit()
-                stats["stored"] += 1
+        if pr.url not in existing:
+            existing.add(pr.url)
+            pending.append(EnforcementAction(
+                state="VA",
+                date_announced=pr.date or since,
+                action_type="other",
+                status="announced",
+                headline=pr.title,
+                source_url=pr.url,
+                raw_text=pr.body_text[:10000] if pr.body_text else "",
+            ))
+            if len(pending) >= WRITE_BATCH_SIZE:
+                _flush_inserts(db, pending, stats)
+    _flush_inserts(db, pending, stats)
 
     await scraper.close()
     return stats
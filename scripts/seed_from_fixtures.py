@@ -6,15 +6,19 @@ Run: python scripts/seed_from_fixtures.py
 
 from __future__ import annotations
 
+import functools
 import glob
 import logging
 import sys
 import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
 
 import yaml
+from sqlalchemy import insert, select
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -32,12 +36,13 @@ from src.storage.models import (
     MonetaryTerms,
     StatuteCited,
 )
-from src.validation.schemas import PressReleaseListItem
+from src.validation.schemas import EnforcementActionSchema, PressReleaseListItem
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
 FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+TAXONOMY_PATH = Path(__file__).parent.parent / "config" / "taxonomy.yaml"
 
 # Map fixture files to their real titles and dates (from listing pages)
 FIXTURE_METADATA = {
@@ -170,134 +175,215 @@ FIXTURE_METADATA = {
 }
 
 
+def _fixture_url(state_key: str, fixture_stem: str) -> str:
+    """Placeholder source URL identifying a seeded fixture."""
+    return f"https://fixture/{state_key}/{fixture_stem}"
+
+
+@functools.cache
+def _get_extractor() -> PressReleaseExtractor:
+    """Build the extractor once per process."""
+    with open(TAXONOMY_PATH) as f:
+        return PressReleaseExtractor(yaml.safe_load(f))
+
+
+def _process_fixture(
+    state_key: str, fixture_stem: str, meta: dict,
+) -> EnforcementActionSchema | None:
+    """Parse, filter and extract one fixture; None if it is not enforcement.
+
+    Runs in a worker process, so it only reads the fixture file and never
+    touches the database.
+    """
+    scraper = get_scraper(state_key)
+    fixture_path = FIXTURES_DIR / state_key / f"{fixture_stem}.html"
+    html = fixture_path.read_text(encoding="utf-8")
+
+    # Parse detail page
+    dummy_item = PressReleaseListItem(
+        title=meta["title"],
+        url=_fixture_url(state_key, fixture_stem),
+        date=meta["date"],
+        state=scraper.state_code,
+    )
+    pr = scraper._parse_detail_page(html, dummy_item)
+
+    # Check enforcement filter
+    filter_result = is_enforcement_action(meta["title"], pr.body_text)
+    if not filter_result.is_enforcement:
+        return None
+
+    # Extract structured data
+    return _get_extractor().extract(pr, date_announced=meta["date"])
+
+
 def seed():
     """Run the full extraction pipeline on all fixture detail pages and store results."""
     db = Database()
     db.create_tables()
 
-    with open(Path(__file__).parent.parent / "config" / "taxonomy.yaml") as f:
-        taxonomy = yaml.safe_load(f)
-
-    extractor = PressReleaseExtractor(taxonomy)
     resolver = EntityResolver()
 
     total_inserted = 0
-    total_skipped = 0
     total_rejected = 0
 
+    # Phase 1: pick out new fixtures, then parse, filter and extract them
+    # across processes. executor.map keeps fixture order, so defendants are
+    # still resolved in a stable order below.
+    work: list[tuple[str, str, dict]] = []
     for state_key, fixtures in FIXTURE_METADATA.items():
-        scraper = get_scraper(state_key)
-        logger.info("Processing %s (%s) — %d fixtures", state_key, scraper.state_code, len(fixtures))
-
+        logger.info("Processing %s — %d fixtures", state_key, len(fixtures))
         for fixture_stem, meta in fixtures.items():
             fixture_path = FIXTURES_DIR / state_key / f"{fixture_stem}.html"
             if not fixture_path.exists():
                 logger.warning("Fixture not found: %s", fixture_path)
                 continue
-
-            html = fixture_path.read_text(encoding="utf-8")
-            source_url = f"https://fixture/{state_key}/{fixture_stem}"
-
-            # Check idempotency
-            if db.action_exists(source_url):
-                total_skipped += 1
-                continue
-
-            # Parse detail page
-            dummy_item = PressReleaseListItem(
-                title=meta["title"],
-                url=source_url,
-                date=meta["date"],
-                state=scraper.state_code,
+            work.append((state_key, fixture_stem, meta))
+
+    # Check idempotency
+    existing = db.existing_urls(_fixture_url(state_key, stem) for state_key, stem, _ in work)
+    new_work = [item for item in work if _fixture_url(item[0], item[1]) not in existing]
+    total_skipped = len(work) - len(new_work)
+
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_process_fixture, *zip(*new_work, strict=True))) if new_work else []
+
+    extracted: dict[str, list[tuple[str, dict, EnforcementActionSchema]]] = {}
+    for (state_key, fixture_stem, meta), result in zip(new_work, results, strict=True):
+        if result is None:
+            logger.info("  REJECTED (not enforcement): %s", meta["title"][:60])
+            total_rejected += 1
+            continue
+        extracted.setdefault(state_key, []).append(
+            (_fixture_url(state_key, fixture_stem), meta, result)
+        )
+
+    # Phase 2: resolve each distinct defendant name once, in first-seen
+    # order so fuzzy matches see the same growing entity set as before
+    raw_names = dict.fromkeys(
+        d_schema.raw_name
+        for state_results in extracted.values()
+        for _, _, result in state_results
+        for d_schema in result.defendants
+    )
+    resolved = {
+        raw: (canonical, confidence)
+        for raw, canonical, confidence in resolver.resolve_batch(list(raw_names))
+    }
+    metadata_by_name = {
+        canonical: resolver.get_metadata(canonical)
+        for canonical, _ in resolved.values()
+    }
+
+    # Canonical name → existing Defendant id, so recurring defendants are
+    # linked rather than re-inserted
+    with db.get_session() as session:
+        defendant_ids: dict[str, str] = dict(session.execute(
+            select(Defendant.canonical_name, Defendant.id)
+            .where(Defendant.canonical_name != "")
+        ).all())
+
+    # Phase 3: write each state's rows in one transaction
+    action_types: Counter[str] = Counter()
+    total_monetary = Decimal("0")
+    for state_results in extracted.values():
+        actions: list[dict] = []
+        mts: list[dict] = []
+        vcs: list[dict] = []
+        scs: list[dict] = []
+        defs: list[dict] = []
+        links: list[dict] = []
+
+        for source_url, meta, result in state_results:
+            # Queue rows for the state's batched insert
+            action_id = str(result.id)
+            actions.append({
+                "id": action_id,
+                "state": result.state,
+                "date_announced": result.date_announced,
+                "date_filed": result.date_filed,
+                "date_resolved": result.date_resolved,
+                "action_type": result.action_type.value,
+                "status": result.status.value,
+                "headline": result.headline,
+                "summary": result.summary,
+                "source_url": source_url,
+                "is_multistate": result.is_multistate,
+                "quality_score": result.quality_score,
+                "extraction_method": result.extraction_method.value,
+                "raw_text": result.raw_text[:5000],  # Truncate for DB
+            })
+
+            # Add monetary terms
+            if result.monetary_terms:
+                mts.append({
+                    "action_id": action_id,
+                    "total_amount": result.monetary_terms.total_amount,
+                    "civil_penalty": result.monetary_terms.civil_penalty,
+                    "consumer_restitution": result.monetary_terms.consumer_restitution,
+                    "fees_and_costs": result.monetary_terms.fees_and_costs,
+                    "amount_is_estimated": result.monetary_terms.amount_is_estimated,
+                })
+
+            # Add violation categories
+            vcs.extend(
+                {
+                    "action_id": action_id,
+                    "category": vc.category,
+                    "subcategory": vc.subcategory,
+                    "confidence": vc.confidence,
+                }
+                for vc in result.violation_categories
             )
-            pr = scraper._parse_detail_page(html, dummy_item)
 
-            # Check enforcement filter
-            filter_result = is_enforcement_action(meta["title"], pr.body_text)
-            if not filter_result.is_enforcement:
-                logger.info("  REJECTED (not enforcement): %s", meta["title"][:60])
-                total_rejected += 1
-                continue
-
-            # Extract structured data
-            result = extractor.extract(pr, date_announced=meta["date"])
+            # Add statutes
+            scs.extend(
+                {
+                    "action_id": action_id,
+                    "statute_raw": sc.statute_raw,
+                    "statute_normalized": sc.statute_normalized,
+                    "statute_name": sc.statute_name,
+                    "is_state_statute": sc.is_state_statute,
+                    "is_federal_statute": sc.is_federal_statute,
+                }
+                for sc in result.statutes_cited
+            )
 
-            # Store in database
-            with db.get_session() as session:
-                action = EnforcementAction(
-                    id=str(result.id),
-                    state=result.state,
-                    date_announced=result.date_announced,
-                    date_filed=result.date_filed,
-                    date_resolved=result.date_resolved,
-                    action_type=result.action_type.value,
-                    status=result.status.value,
-                    headline=result.headline,
-                    summary=result.summary,
-                    source_url=source_url,
-                    is_multistate=result.is_multistate,
-                    quality_score=result.quality_score,
-                    extraction_method=result.extraction_method.value,
-                    raw_text=result.raw_text[:5000],  # Truncate for DB
-                )
-                session.add(action)
-
-                # Add monetary terms
-                if result.monetary_terms:
-                    mt = MonetaryTerms(
-                        action_id=str(result.id),
-                        total_amount=result.monetary_terms.total_amount,
-                        civil_penalty=result.monetary_terms.civil_penalty,
-                        consumer_restitution=result.monetary_terms.consumer_restitution,
-                        fees_and_costs=result.monetary_terms.fees_and_costs,
-                        amount_is_estimated=result.monetary_terms.amount_is_estimated,
-                    )
-                    session.add(mt)
-
-                # Add violation categories
-                for vc in result.violation_categories:
-                    session.add(ViolationCategory(
-                        action_id=str(result.id),
-                        category=vc.category,
-                        subcategory=vc.subcategory,
-                        confidence=vc.confidence,
-                    ))
-
-                # Add statutes
-                for sc in result.statutes_cited:
-                    session.add(StatuteCited(
-                        action_id=str(result.id),
-                        statute_raw=sc.statute_raw,
-                        statute_normalized=sc.statute_normalized,
-                        statute_name=sc.statute_name,
-                        is_state_statute=sc.is_state_statute,
-                        is_federal_statute=sc.is_federal_statute,
-                    ))
-
-                # Add defendants with entity resolution
-                for d_schema in result.defendants:
-                    canonical, confidence = resolver.resolve(d_schema.raw_name)
-                    metadata = resolver.get_metadata(canonical)
-
-                    defendant = Defendant(
-                        raw_name=d_schema.raw_name,
-                        canonical_name=canonical,
-                        entity_type=metadata.get("entity_type", "corporation"),
-                        industry=metadata.get("industry"),
-                        sec_cik=metadata.get("sec_cik"),
-                    )
-                    session.add(defendant)
-                    session.flush()
-
-                    session.add(ActionDefendant(
-                        action_id=str(result.id),
-                        defendant_id=defendant.id,
-                        role="primary",
-                    ))
+            # Add defendants with entity resolution. A canonical name seen
+            # before reuses its Defendant row; new ids are generated here so
+            # the links can be built without flushing each defendant.
+            link_ids: dict[str, None] = {}  # ordered set of defendant ids to link
+            for d_schema in result.defendants:
+                canonical, confidence = resolved[d_schema.raw_name]
+                if canonical in defendant_ids:
+                    link_ids[defendant_ids[canonical]] = None
+                    continue
+
+                metadata = metadata_by_name[canonical]
+                defendant_id = str(uuid.uuid4())
+                defs.append({
+                    "id": defendant_id,
+                    "raw_name": d_schema.raw_name,
+                    "canonical_name": canonical,
+                    "entity_type": metadata.get("entity_type", "corporation"),
+                    "industry": metadata.get("industry"),
+                    "sec_cik": metadata.get("sec_cik"),
+                })
+                # Rejected names resolve to "" and must not collapse into one row
+                if canonical:
+                    defendant_ids[canonical] = defendant_id
+                link_ids[defendant_id] = None
+
+            links.extend(
+                {"action_id": action_id, "defendant_id": defendant_id, "role": "primary"}
+                for defendant_id in link_ids
+            )
 
-                session.commit()
-                total_inserted += 1
-                logger.info(
+            action_types[result.action_type.value] += 1
+            if result.monetary_terms:
+                total_monetary += result.monetary_terms.total_amount
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
                     "  OK: %s | type=%s amount=%s defendants=%d cats=%s",
                     meta["title"][:50],
                     result.action_type.value,
@@ -306,10 +392,32 @@ def seed():
                     [vc.category for vc in result.violation_categories],
                 )
 
+        # Store the state's fixtures in one transaction, parents first
+        if actions:
+            with db.get_session() as session:
+                for model, rows in (
+                    (EnforcementAction, actions),
+                    (MonetaryTerms, mts),
+                    (ViolationCategory, vcs),
+                    (StatuteCited, scs),
+                    (Defendant, defs),
+                    (ActionDefendant, links),
+                ):
+                    if rows:
+                        session.execute(insert(model), rows)
+                session.commit()
+            total_inserted += len(actions)
+
     logger.info(
         "\nSeed complete: %d inserted, %d skipped (existing), %d rejected (non-enforcement)",
         total_inserted, total_skipped, total_rejected,
     )
+    if action_types:
+        logger.info(
+            "By action type: %s",
+            ", ".join(f"{name}={count}" for name, count in action_types.most_common()),
+        )
+        logger.info("Total monetary relief: $%s", f"{total_monetary:,.0f}")
 
     # Show review queue from entity resolver
     review = resolver.get_review_queue()
@@ -9,20 +9,33 @@ Run: python scripts/wayback_scrape.py --states ny,pa --since 2022-01-01
 from __future__ import annotations
 
 import asyncio
+import codecs
+import functools
 import logging
 import re
 import sys
 import time
 from datetime import date, datetime
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import click
 import httpx
+from dateparser.date import DateDataParser
+from sqlalchemy import insert
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from selectolax.parser import HTMLParser
+try:
+    import uvloop
+except ImportError:  # optional speedup; the stdlib event loop is used without it
+    uvloop = None
+try:
+    import h2  # noqa: F401
+except ImportError:  # optional; httpx needs it for HTTP/2, else HTTP/1.1 keep-alive
+    h2 = None
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from src.scrapers.base import DEFAULT_USER_AGENT
 from src.storage.database import Database
 from src.storage.models import EnforcementAction
 
@@ -33,83 +46,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger("wayback")
 
-# State config for Wayback Machine scraping
-WAYBACK_STATES = {
-    "ny": {
-        "code": "NY",
-        "name": "New York",
-        "cdx_pattern": "ag.ny.gov/press-release/{year}/*",
-        "years": range(2022, 2027),
-        "body_selector": ".node__content",
-        "title_from_url": True,  # NY URLs contain year/month/slug
-        "date_pattern": r"/press-release/(\d{4})/(\d{1,2})/",
-    },
-    "pa": {
-        "code": "PA",
-        "name": "Pennsylvania",
-        "cdx_pattern": "www.attorneygeneral.gov/taking-action/{slug}",
-        "years": None,  # PA URLs don't have year in path
-        "cdx_url_all": "www.attorneygeneral.gov/taking-action/*",
-        "body_selector": ".entry-content",
-        "exclude_patterns": [
-            r"/taking-action/?$",
-            r"/taking-action/page/\d+",
-            r"/taking-action/?(\?|#)",
-        ],
-        "date_selector": ".entry-date, time, .posted-on",
-    },
-    "ct": {
-        "code": "CT",
-        "name": "Connecticut",
-        "cdx_pattern": "portal.ct.gov/ag/press-releases/{year}-press-releases/*",
-        "years": range(2022, 2027),
-        "body_selector": ".content",
-        "exclude_patterns": [
-            r"/\d{4}-press-releases/?$",   # listing pages like /2024-Press-Releases
-            r"/press-releases/?$",          # main listing page
-            r"ag-press-release-template",
-        ],
-        # Minimum body length to reject empty/nav-only pages
-        "min_body_length": 200,
-    },
-    "ma": {
-        "code": "MA",
-        "name": "Massachusetts",
-        "cdx_pattern": "mass.gov/news/ag-*",
-        "years": None,
-        "body_selector": ".page-content",
-        "exclude_patterns": [
-            r"\?.*=",  # URLs with query params are duplicates
-        ],
-    },
-    "il": {
-        "code": "IL",
-        "name": "Illinois",
-        "cdx_pattern": "illinoisattorneygeneral.gov/pressroom/{year}_*",
-        "years": range(2022, 2027),
-        "body_selector": "td[bgcolor='#FFFFFF']",
-        "exclude_patterns": [
-            r"/index\.html$",
-            r"/pressroom/?$",
-        ],
-    },
-    "wa": {
-        "code": "WA",
-        "name": "Washington",
-        "cdx_pattern": "atg.wa.gov/news/news-releases/*",
-        "years": None,
-        "body_selector": "#block-atg-content article",
-        "exclude_patterns": [
-            r"/NEWS/NEWS-RELEASES/?$",
-            r"/news/news-releases/?$",
-            r"/news/news-releases/\d{4}$",
-        ],
-    },
-}
+# Snapshots in flight per state
+FETCH_CONCURRENCY = 5
+
+# Snapshot request starts per second across the whole run. Starts are spaced
+# evenly; the in-flight slots let slow responses overlap without bursting
+FETCH_RATE = 5.0
+
+# Every request goes to web.archive.org, so all states share one pooled
+# client. The per-state semaphores bound the load, so waiting for a free
+# pooled connection is never treated as a timeout
+CLIENT_TIMEOUT = httpx.Timeout(30, pool=None)
+CDX_TIMEOUT = httpx.Timeout(60, pool=None)
+
+# Snapshots fetched per gather round; bounds how many pages sit in memory
+FETCH_BATCH_SIZE = 100
+
+# Scraped rows are inserted this many at a time, one transaction per batch
+STORE_BATCH_SIZE = 100
+
+# Generic content containers tried in priority order when a state's body
+# selector misses. Kept as separate lookups rather than one selector group:
+# a group returns the first match in document order, which would prefer an
+# outer .content over the article nested inside it
+BODY_FALLBACKS = ("article", "main", ".content", "#content", ".field--name-body")
+
+# Markers around the banner the Wayback Machine can inject into replays
+_TOOLBAR_BEGIN = b"<!-- BEGIN WAYBACK TOOLBAR INSERT -->"
+_TOOLBAR_END = b"<!-- END WAYBACK TOOLBAR INSERT -->"
+
+# Separators between a <title>'s headline and the site name
+_TITLE_SUFFIX_RE = re.compile(r" [|\-—] ")
+_NY_DATE_RE = re.compile(r"/press-release/(\d{4})/(\d{1,2})/")
+_PA_LISTING_PAGE_RE = re.compile(r"/taking-action/page/\d+$")
+_CT_DATE_RE = re.compile(r"(\d{2}/\d{2}/\d{4})")
+_IL_DATE_RE = re.compile(r"/pressroom/(\d{4})_(\d{2})/(\d{4})(\d{2})(\d{2})")
+_IL_MONTH_RE = re.compile(r"/pressroom/(\d{4})_(\d{2})/")
+_WA_DATE_RE = re.compile(
+    r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2},?\s+\d{4})"
+)
+
+# Every archived site is English; pinning the language skips dateparser's
+# per-call language detection, which is most of its cost
+_DATE_PARSER = DateDataParser(languages=["en"])
+
+# MM/DD/YYYY (CT, MA), "January 9, 2023" (PA, IL, WA) and ISO dates
+_FAST_DATE_FORMATS = ("%m/%d/%Y", "%B %d, %Y", "%b %d, %Y", "%Y-%m-%d")
 
 
-async def query_cdx(url_pattern: str, since: str = "20220101", limit: int = 5000) -> list[dict]:
-    """Query CDX API and return list of {timestamp, url}."""
+async def query_cdx(
+    url_pattern: str,
+    since: str = "20220101",
+    limit: int = 5000,
+    client: httpx.AsyncClient | None = None,
+) -> list[dict]:
+    """Query CDX API and return list of {timestamp, url}.
+
+    Pass ``client`` to reuse its connections across several queries;
+    otherwise a client is opened for this one call.
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=60) as client:
+            return await query_cdx(url_pattern, since, limit, client)
+
     cdx_url = "https://web.archive.org/cdx/search/cdx"
     params = [
         ("url", url_pattern),
@@ -121,35 +120,139 @@ async def query_cdx(url_pattern: str, since: str = "20220101", limit: int = 5000
         ("collapse", "urlkey"),
         ("limit", str(limit)),
     ]
-    async with httpx.AsyncClient(timeout=60) as client:
-        r = await client.get(cdx_url, params=params)
-        r.raise_for_status()
 
+    # Parse rows as they arrive rather than holding the whole response text
     results = []
-    for line in r.text.strip().split("\n"):
-        if not line.strip():
-            continue
-        parts = line.strip().split(" ", 1)
-        if len(parts) == 2:
-            results.append({"timestamp": parts[0], "url": parts[1]})
+    async with client.stream("GET", cdx_url, params=params, timeout=CDX_TIMEOUT) as r:
+        r.raise_for_status()
+        async for line in r.aiter_lines():
+            timestamp, sep, url = line.strip().partition(" ")
+            if sep:
+                results.append({"timestamp": timestamp, "url": url})
     return results
 
 
-async def fetch_wayback_page(client: httpx.AsyncClient, timestamp: str, url: str) -> str | None:
-    """Fetch a page from the Wayback Machine."""
+async def fetch_wayback_page(client: httpx.AsyncClient, timestamp: str, url: str) -> bytes | None:
+    """Fetch a page from the Wayback Machine as UTF-8 encoded HTML."""
     wayback_url = f"https://web.archive.org/web/{timestamp}id_/{url}"
     try:
         r = await client.get(wayback_url)
         r.raise_for_status()
-        return r.text
+        # The parser reads UTF-8 bytes directly, so skip the str round trip
+        # unless the page declared some other charset
+        if codecs.lookup(r.encoding).name == "utf-8":
+            return r.content
+        return r.text.encode()
     except Exception as e:
         logger.warning("Failed to fetch %s: %s", wayback_url, e)
         return None
 
 
-def extract_title_from_html(html: str) -> str:
-    """Extract title from HTML page."""
-    tree = HTMLParser(html)
+class Throttle:
+    """Spaces request starts at most ``rate`` per second across all callers.
+
+    Callers queue on a lock, as in BaseScraper._throttle, so concurrent
+    fetches keep a steady rate against the Wayback Machine while their
+    responses overlap.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = loop.time() + self.interval
+
+
+def strip_wayback_toolbar(html: bytes) -> bytes:
+    """Cut out the archive.org toolbar if the replay injected one.
+
+    ``id_`` snapshots normally come back untouched, but when the banner is
+    present it is dozens of nodes the parser would otherwise build.
+    """
+    begin = html.find(_TOOLBAR_BEGIN)
+    if begin == -1:
+        return html
+    end = html.find(_TOOLBAR_END, begin)
+    if end == -1:
+        return html
+    return html[:begin] + html[end + len(_TOOLBAR_END):]
+
+
+async def fetch_snapshots(client: httpx.AsyncClient, entries: list[dict], throttle: Throttle):
+    """Fetch snapshots for CDX entries with bounded concurrency.
+
+    Yields ``(index, entry, html)`` in input order. ``html`` is None for a
+    failed fetch, or the exception if the fetch task itself raised.
+    """
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def fetch(entry: dict) -> bytes | None:
+        async with sem:
+            await throttle.wait()
+            return await fetch_wayback_page(client, entry["timestamp"], entry["url"])
+
+    for start in range(0, len(entries), FETCH_BATCH_SIZE):
+        chunk = entries[start:start + FETCH_BATCH_SIZE]
+        pages = await asyncio.gather(*(fetch(entry) for entry in chunk), return_exceptions=True)
+        for offset, (entry, html) in enumerate(zip(chunk, pages, strict=True)):
+            yield start + offset, entry, html
+
+
+def _store_batch(db: Database, pending: list[dict], stats: dict) -> None:
+    """Insert queued press releases in one transaction and clear the queue.
+
+    Runs without awaiting, so the SQLite write lock is never held while
+    other states' tasks run. A failed batch is logged and counted as errors
+    rather than raised, so the rest of the state's snapshots still get stored.
+    """
+    if not pending:
+        return
+    try:
+        with db.get_session() as session:
+            session.execute(insert(EnforcementAction), pending)
+            session.commit()
+        stats["stored"] += len(pending)
+    except Exception as e:
+        stats["errors"] += len(pending)
+        logger.warning("[%s] Failed to store %d records: %s", stats["state"], len(pending), e)
+    pending.clear()
+
+
+def normalize_url(url: str) -> str:
+    """Give a schemeless CDX URL an https scheme; schemed URLs pass through."""
+    return url if url.startswith(("http://", "https://")) else "https://" + url
+
+
+def filter_known_urls(db: Database, entries: list[dict], stats: dict) -> list[dict]:
+    """Return CDX entries not yet stored, with URLs normalised to https.
+
+    source_url is unique across all states, so the normalised URLs are
+    checked against every stored row with one existing_urls call rather
+    than a query per URL. URLs kept here join the set, so a repeated
+    capture is counted as skipped instead of colliding inside an insert
+    batch.
+    """
+    urls = [normalize_url(r["url"]) for r in entries]
+    known_urls = db.existing_urls(urls)
+    new_urls = []
+    for r, url in zip(entries, urls, strict=True):
+        if url not in known_urls:
+            known_urls.add(url)
+            new_urls.append({**r, "url": url})
+        else:
+            stats["skipped"] += 1
+    return new_urls
+
+
+def extract_title(tree: HTMLParser) -> str:
+    """Extract title from a parsed page."""
     # Try h1 first
     h1 = tree.css_first("h1")
     if h1:
@@ -157,32 +260,44 @@ def extract_title_from_html(html: str) -> str:
     # Try <title>
     title = tree.css_first("title")
     if title:
+        # Strip site name suffix: everything from the first separator on
         text = title.text(strip=True)
-        # Strip site name suffix
-        for sep in [" | ", " - ", " — "]:
-            if sep in text:
-                text = text.split(sep)[0].strip()
-        return text
+        return _TITLE_SUFFIX_RE.split(text, maxsplit=1)[0].strip()
     return ""
 
 
-def extract_body_text(html: str, selector: str) -> str:
+def extract_body_text(tree: HTMLParser, selector: str) -> str:
     """Extract body text using CSS selector with fallbacks."""
-    tree = HTMLParser(html)
     node = tree.css_first(selector)
+    if not node:
+        for sel in BODY_FALLBACKS:
+            node = tree.css_first(sel)
+            if node:
+                break
     if node:
         return node.text(separator="\n", strip=True)
-    # Fallbacks
-    for sel in ["article", "main", ".content", "#content", ".field--name-body"]:
-        node = tree.css_first(sel)
-        if node:
-            return node.text(separator="\n", strip=True)
     return ""
 
 
-def extract_date_ny(url: str) -> date | None:
+@functools.lru_cache(maxsize=8192)
+def _parse_date(text: str) -> date | None:
+    """Parse a date string from a release page, memoised on the exact text.
+
+    The layouts the archived sites actually use are tried with strptime
+    first; anything else goes to dateparser.
+    """
+    for fmt in _FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+    parsed = _DATE_PARSER.get_date_data(text).date_obj
+    return parsed.date() if parsed else None
+
+
+def extract_date_ny(tree: HTMLParser, url: str) -> date | None:
     """Extract date from NY URL pattern /press-release/YYYY/MM/slug."""
-    m = re.search(r"/press-release/(\d{4})/(\d{1,2})/", url)
+    m = _NY_DATE_RE.search(url)
     if m:
         try:
             return date(int(m.group(1)), int(m.group(2)), 1)
@@ -191,10 +306,8 @@ def extract_date_ny(url: str) -> date | None:
     return None
 
 
-def extract_date_pa(html: str) -> date | None:
+def extract_date_pa(tree: HTMLParser, url: str) -> date | None:
     """Extract date from PA page HTML."""
-    import dateparser
-    tree = HTMLParser(html)
     for sel in [".entry-date", "time", ".posted-on", ".ta-card-date"]:
         node = tree.css_first(sel)
         if node:
@@ -207,158 +320,72 @@ def extract_date_pa(html: str) -> date | None:
                     pass
             text = node.text(strip=True)
             if text:
-                parsed = dateparser.parse(text)
+                parsed = _parse_date(text)
                 if parsed:
-                    return parsed.date()
+                    return parsed
     return None
 
 
-async def scrape_ny(db: Database, since: date) -> dict:
-    """Scrape NY press releases from Wayback Machine."""
-    config = WAYBACK_STATES["ny"]
-    stats = {"state": "NY", "found": 0, "stored": 0, "skipped": 0, "errors": 0}
-
-    # Get all archived detail page URLs
-    all_urls = []
-    for year in config["years"]:
-        pattern = f"ag.ny.gov/press-release/{year}/*"
-        results = await query_cdx(pattern, since=since.strftime("%Y%m%d"))
-        all_urls.extend(results)
-        logger.info("[NY] CDX year %d: %d URLs", year, len(results))
-
-    stats["found"] = len(all_urls)
-    logger.info("[NY] Total unique archived URLs: %d", len(all_urls))
-
-    # Filter out already-scraped
-    new_urls = []
-    for r in all_urls:
-        url = r["url"]
-        if not url.startswith("https://"):
-            url = "https://" + url if not url.startswith("http") else url
-        if not db.action_exists(url):
-            new_urls.append({**r, "url": url})
-        else:
-            stats["skipped"] += 1
-
-    logger.info("[NY] New URLs to fetch: %d (skipped %d existing)", len(new_urls), stats["skipped"])
-
-    # Fetch detail pages
-    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-        for i, entry in enumerate(new_urls):
-            url = entry["url"]
-            ts = entry["timestamp"]
-
-            try:
-                html = await fetch_wayback_page(client, ts, url)
-                if not html:
-                    stats["errors"] += 1
-                    continue
-
-                title = extract_title_from_html(html)
-                body = extract_body_text(html, config["body_selector"])
-                pr_date = extract_date_ny(url) or since
-
-                if not title or not body:
-                    stats["errors"] += 1
-                    continue
-
-                # Store
-                if not db.action_exists(url):
-                    with db.get_session() as session:
-                        action = EnforcementAction(
-                            state="NY",
-                            date_announced=pr_date,
-                            action_type="other",
-                            status="announced",
-                            headline=title,
-                            source_url=url,
-                            raw_text=body[:10000],
-                        )
-                        session.add(action)
-                        session.commit()
-                        stats["stored"] += 1
-
-                if (i + 1) % 50 == 0:
-                    logger.info("[NY] Progress: %d/%d fetched, %d stored",
-                                i + 1, len(new_urls), stats["stored"])
-
-                # Rate limit for Wayback
-                await asyncio.sleep(1.0)
-
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning("[NY] Error fetching %s: %s", url, e)
-
-    return stats
-
-
-def extract_date_ct(html: str) -> date | None:
+def extract_date_ct(tree: HTMLParser, url: str) -> date | None:
     """Extract date from CT press release HTML.
 
     CT detail pages have date as MM/DD/YYYY in .content (line 2),
     or sometimes in a <p class="date"> tag.
     """
-    import dateparser
-    tree = HTMLParser(html)
-
     # Method 1: <p class="date"> tag
     date_node = tree.css_first("p.date")
     if date_node:
         text = date_node.text(strip=True)
         if text:
-            parsed = dateparser.parse(text)
+            parsed = _parse_date(text)
             if parsed:
-                return parsed.date()
+                return parsed
 
     # Method 2: MM/DD/YYYY in .content text (line 2)
     content = tree.css_first(".content")
     if content:
         text = content.text(separator="\n", strip=True)
-        m = re.search(r'(\d{2}/\d{2}/\d{4})', text)
+        m = _CT_DATE_RE.search(text)
         if m:
-            parsed = dateparser.parse(m.group(1))
+            parsed = _parse_date(m.group(1))
             if parsed:
-                return parsed.date()
+                return parsed
 
     return None
 
 
-def extract_date_ma(html: str) -> date | None:
+def extract_date_ma(tree: HTMLParser, url: str) -> date | None:
     """Extract date from MA press release HTML."""
-    import dateparser
-    tree = HTMLParser(html)
     # MA uses <div class="ma__press-status__date">10/09/2024</div>
     date_node = tree.css_first(".ma__press-status__date")
     if date_node:
         text = date_node.text(strip=True)
         if text:
-            parsed = dateparser.parse(text)
+            parsed = _parse_date(text)
             if parsed:
-                return parsed.date()
+                return parsed
     return None
 
 
-def extract_date_il(html: str, url: str) -> date | None:
+def extract_date_il(tree: HTMLParser, url: str) -> date | None:
     """Extract date from IL press release HTML or URL."""
-    import dateparser
-    tree = HTMLParser(html)
     # IL uses <p class="dateformat"><strong>January 9, 2023</strong></p>
     date_node = tree.css_first("p.dateformat")
     if date_node:
         text = date_node.text(strip=True)
         if text:
-            parsed = dateparser.parse(text)
+            parsed = _parse_date(text)
             if parsed:
-                return parsed.date()
+                return parsed
     # Fallback: extract from URL pattern /pressroom/YYYY_MM/YYYYMMDD.html
-    m = re.search(r"/pressroom/(\d{4})_(\d{2})/(\d{4})(\d{2})(\d{2})", url)
+    m = _IL_DATE_RE.search(url)
     if m:
         try:
             return date(int(m.group(3)), int(m.group(4)), int(m.group(5)))
         except ValueError:
             pass
     # Broader fallback: just year and month from directory
-    m = re.search(r"/pressroom/(\d{4})_(\d{2})/", url)
+    m = _IL_MONTH_RE.search(url)
     if m:
         try:
             return date(int(m.group(1)), int(m.group(2)), 15)
@@ -367,403 +394,44 @@ def extract_date_il(html: str, url: str) -> date | None:
     return None
 
 
-def extract_title_ct(html: str) -> str:
+def extract_title_ct(tree: HTMLParser) -> str:
     """Extract title from CT press release — uses h3 inside .content."""
-    tree = HTMLParser(html)
     content = tree.css_first(".content")
     if content:
         h3 = content.css_first("h3")
         if h3:
             return h3.text(strip=True)
-    return extract_title_from_html(html)
+    return extract_title(tree)
 
 
-def extract_title_il(html: str) -> str:
+def extract_title_il(tree: HTMLParser) -> str:
     """Extract title from IL press release — uses h2.presscontent."""
-    tree = HTMLParser(html)
     h2 = tree.css_first("h2.presscontent")
     if h2:
         return h2.text(strip=True)
-    return extract_title_from_html(html)
-
-
-async def scrape_pa(db: Database, since: date) -> dict:
-    """Scrape PA press releases from Wayback Machine."""
-    config = WAYBACK_STATES["pa"]
-    stats = {"state": "PA", "found": 0, "stored": 0, "skipped": 0, "errors": 0}
-
-    # Get all archived URLs
-    results = await query_cdx(
-        "www.attorneygeneral.gov/taking-action/*",
-        since=since.strftime("%Y%m%d"),
-        limit=10000,
-    )
-
-    # Filter out listing/pagination pages
-    detail_urls = []
-    for r in results:
-        url = r["url"]
-        skip = False
-        for pattern in config["exclude_patterns"]:
-            if re.search(pattern, url):
-                skip = True
-                break
-        if not skip and "/taking-action/" in url:
-            # Must have a slug after /taking-action/
-            path = urlparse(url).path.rstrip("/")
-            if path != "/taking-action" and not re.match(r"/taking-action/page/\d+$", path):
-                detail_urls.append(r)
-
-    stats["found"] = len(detail_urls)
-    logger.info("[PA] Total unique detail URLs: %d (from %d CDX results)", len(detail_urls), len(results))
-
-    # Filter already-scraped
-    new_urls = []
-    for r in detail_urls:
-        url = r["url"]
-        if not url.startswith("https://"):
-            url = "https://" + url if not url.startswith("http") else url
-        if not db.action_exists(url):
-            new_urls.append({**r, "url": url})
-        else:
-            stats["skipped"] += 1
-
-    logger.info("[PA] New URLs to fetch: %d (skipped %d existing)", len(new_urls), stats["skipped"])
-
-    # Fetch detail pages
-    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-        for i, entry in enumerate(new_urls):
-            url = entry["url"]
-            ts = entry["timestamp"]
-
-            try:
-                html = await fetch_wayback_page(client, ts, url)
-                if not html:
-                    stats["errors"] += 1
-                    continue
-
-                title = extract_title_from_html(html)
-                body = extract_body_text(html, config["body_selector"])
-                pr_date = extract_date_pa(html) or since
-
-                if not title or not body:
-                    stats["errors"] += 1
-                    continue
-
-                # Store
-                if not db.action_exists(url):
-                    with db.get_session() as session:
-                        action = EnforcementAction(
-                            state="PA",
-                            date_announced=pr_date,
-                            action_type="other",
-                            status="announced",
-                            headline=title,
-                            source_url=url,
-                            raw_text=body[:10000],
-                        )
-                        session.add(action)
-                        session.commit()
-                        stats["stored"] += 1
-
-                if (i + 1) % 50 == 0:
-                    logger.info("[PA] Progress: %d/%d fetched, %d stored",
-                                i + 1, len(new_urls), stats["stored"])
-
-                # Rate limit for Wayback
-                await asyncio.sleep(1.0)
-
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning("[PA] Error fetching %s: %s", url, e)
-
-    return stats
-
-
-async def scrape_ct(db: Database, since: date) -> dict:
-    """Scrape CT press releases from Wayback Machine."""
-    config = WAYBACK_STATES["ct"]
-    stats = {"state": "CT", "found": 0, "stored": 0, "skipped": 0, "errors": 0}
-
-    all_urls = []
-    for year in config["years"]:
-        pattern = f"portal.ct.gov/ag/press-releases/{year}-press-releases/*"
-        results = await query_cdx(pattern, since=since.strftime("%Y%m%d"))
-        all_urls.extend(results)
-        logger.info("[CT] CDX year %d: %d URLs", year, len(results))
-
-    # Filter out listing/index/template pages
-    detail_urls = []
-    for r in all_urls:
-        url = r["url"]
-        skip = False
-        for pattern in config["exclude_patterns"]:
-            if re.search(pattern, url):
-                skip = True
-                break
-        if not skip:
-            detail_urls.append(r)
-
-    stats["found"] = len(detail_urls)
-    logger.info("[CT] Total unique detail URLs: %d", len(detail_urls))
-
-    # Filter already-scraped
-    new_urls = []
-    for r in detail_urls:
-        url = r["url"]
-        if not url.startswith("https://"):
-            url = "https://" + url if not url.startswith("http") else url
-        if not db.action_exists(url):
-            new_urls.append({**r, "url": url})
-        else:
-            stats["skipped"] += 1
-
-    logger.info("[CT] New URLs to fetch: %d (skipped %d existing)", len(new_urls), stats["skipped"])
+    return extract_title(tree)
 
-    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-        for i, entry in enumerate(new_urls):
-            url = entry["url"]
-            ts = entry["timestamp"]
 
-            try:
-                html = await fetch_wayback_page(client, ts, url)
-                if not html:
-                    stats["errors"] += 1
-                    continue
-
-                title = extract_title_ct(html)
-                body = extract_body_text(html, config["body_selector"])
-                pr_date = extract_date_ct(html) or since
-
-                # Reject short/empty body (listing pages, nav-only)
-                min_len = config.get("min_body_length", 100)
-                if not title or not body or len(body) < min_len:
-                    stats["errors"] += 1
-                    continue
-
-                if not db.action_exists(url):
-                    with db.get_session() as session:
-                        action = EnforcementAction(
-                            state="CT",
-                            date_announced=pr_date,
-                            action_type="other",
-                            status="announced",
-                            headline=title,
-                            source_url=url,
-                            raw_text=body[:10000],
-                        )
-                        session.add(action)
-                        session.commit()
-                        stats["stored"] += 1
-
-                if (i + 1) % 50 == 0:
-                    logger.info("[CT] Progress: %d/%d fetched, %d stored",
-                                i + 1, len(new_urls), stats["stored"])
-
-                await asyncio.sleep(1.0)
+def _leading_text(node, limit: int) -> str:
+    """Return ``node.text(separator="\n", strip=True)[:limit]``.
 
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning("[CT] Error fetching %s: %s", url, e)
-
-    return stats
-
-
-async def scrape_ma(db: Database, since: date) -> dict:
-    """Scrape MA press releases from Wayback Machine."""
-    config = WAYBACK_STATES["ma"]
-    stats = {"state": "MA", "found": 0, "stored": 0, "skipped": 0, "errors": 0}
-
-    results = await query_cdx(
-        "mass.gov/news/ag-*",
-        since=since.strftime("%Y%m%d"),
-        limit=5000,
-    )
-
-    # Filter: remove URLs with query params (duplicates) and keep only clean paths
-    detail_urls = []
-    seen_paths = set()
-    for r in results:
-        url = r["url"]
-        skip = False
-        for pattern in config["exclude_patterns"]:
-            if re.search(pattern, url):
-                skip = True
-                break
-        if skip:
-            continue
-        # Deduplicate by path only (ignore http vs https, www vs not)
-        path = urlparse(url).path.rstrip("/")
-        if path in seen_paths:
-            continue
-        seen_paths.add(path)
-        detail_urls.append(r)
-
-    stats["found"] = len(detail_urls)
-    logger.info("[MA] Total unique detail URLs: %d (from %d CDX results)", len(detail_urls), len(results))
-
-    # Filter already-scraped
-    new_urls = []
-    for r in detail_urls:
-        url = r["url"]
-        if not url.startswith("https://"):
-            url = "https://" + url if not url.startswith("http") else url
-        if not db.action_exists(url):
-            new_urls.append({**r, "url": url})
-        else:
-            stats["skipped"] += 1
-
-    logger.info("[MA] New URLs to fetch: %d (skipped %d existing)", len(new_urls), stats["skipped"])
-
-    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-        for i, entry in enumerate(new_urls):
-            url = entry["url"]
-            ts = entry["timestamp"]
-
-            try:
-                html = await fetch_wayback_page(client, ts, url)
-                if not html:
-                    stats["errors"] += 1
-                    continue
-
-                title = extract_title_from_html(html)
-                body = extract_body_text(html, config["body_selector"])
-                pr_date = extract_date_ma(html) or since
-
-                if not title or not body:
-                    stats["errors"] += 1
-                    continue
-
-                if not db.action_exists(url):
-                    with db.get_session() as session:
-                        action = EnforcementAction(
-                            state="MA",
-                            date_announced=pr_date,
-                            action_type="other",
-                            status="announced",
-                            headline=title,
-                            source_url=url,
-                            raw_text=body[:10000],
-                        )
-                        session.add(action)
-                        session.commit()
-                        stats["stored"] += 1
-
-                if (i + 1) % 50 == 0:
-                    logger.info("[MA] Progress: %d/%d fetched, %d stored",
-                                i + 1, len(new_urls), stats["stored"])
-
-                await asyncio.sleep(1.0)
-
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning("[MA] Error fetching %s: %s", url, e)
-
-    return stats
-
-
-async def scrape_il(db: Database, since: date) -> dict:
-    """Scrape IL press releases from Wayback Machine."""
-    config = WAYBACK_STATES["il"]
-    stats = {"state": "IL", "found": 0, "stored": 0, "skipped": 0, "errors": 0}
-
-    all_urls = []
-    for year in config["years"]:
-        # IL uses YYYY_MM directory structure
-        for month in range(1, 13):
-            pattern = f"illinoisattorneygeneral.gov/pressroom/{year}_{month:02d}/*"
-            results = await query_cdx(pattern, since=since.strftime("%Y%m%d"))
-            all_urls.extend(results)
-        logger.info("[IL] CDX year %d: total so far %d URLs", year, len(all_urls))
-
-    # Filter out index pages and deduplicate
-    detail_urls = []
-    seen_paths = set()
-    for r in all_urls:
-        url = r["url"]
-        skip = False
-        for pattern in config["exclude_patterns"]:
-            if re.search(pattern, url):
-                skip = True
+    Walks text nodes only until ``limit`` characters are collected, rather
+    than stringifying the whole subtree to keep its first few lines.
+    """
+    parts = []
+    size = 0
+    for child in node.traverse(include_text=True):
+        if child.tag == "-text":
+            text = (child.text_content or "").strip()
+            parts.append(text)
+            size += len(text) + 1
+            if size > limit:
                 break
-        if skip:
-            continue
-        # Must be an .html file (not directory listing)
-        if not url.endswith(".html"):
-            continue
-        # Deduplicate by path
-        path = urlparse(url).path.rstrip("/")
-        if path in seen_paths:
-            continue
-        seen_paths.add(path)
-        detail_urls.append(r)
-
-    stats["found"] = len(detail_urls)
-    logger.info("[IL] Total unique detail URLs: %d", len(detail_urls))
-
-    # Filter already-scraped
-    new_urls = []
-    for r in detail_urls:
-        url = r["url"]
-        if not url.startswith("https://"):
-            url = "https://" + url if not url.startswith("http") else url
-        if not db.action_exists(url):
-            new_urls.append({**r, "url": url})
-        else:
-            stats["skipped"] += 1
-
-    logger.info("[IL] New URLs to fetch: %d (skipped %d existing)", len(new_urls), stats["skipped"])
-
-    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-        for i, entry in enumerate(new_urls):
-            url = entry["url"]
-            ts = entry["timestamp"]
+    return "\n".join(parts)[:limit]
 
-            try:
-                html = await fetch_wayback_page(client, ts, url)
-                if not html:
-                    stats["errors"] += 1
-                    continue
-
-                title = extract_title_il(html)
-                body = extract_body_text(html, config["body_selector"])
-                pr_date = extract_date_il(html, url) or since
-
-                if not title or not body:
-                    stats["errors"] += 1
-                    continue
-
-                if not db.action_exists(url):
-                    with db.get_session() as session:
-                        action = EnforcementAction(
-                            state="IL",
-                            date_announced=pr_date,
-                            action_type="other",
-                            status="announced",
-                            headline=title,
-                            source_url=url,
-                            raw_text=body[:10000],
-                        )
-                        session.add(action)
-                        session.commit()
-                        stats["stored"] += 1
-
-                if (i + 1) % 50 == 0:
-                    logger.info("[IL] Progress: %d/%d fetched, %d stored",
-                                i + 1, len(new_urls), stats["stored"])
-
-                await asyncio.sleep(1.0)
-
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning("[IL] Error fetching %s: %s", url, e)
-
-    return stats
 
-
-def extract_date_wa(html: str) -> date | None:
+def extract_date_wa(tree: HTMLParser, url: str) -> date | None:
     """Extract date from WA press release HTML."""
-    tree = HTMLParser(html)
     # WA uses <time datetime="2026-02-03T18:55:01-08:00">
     time_node = tree.css_first("time[datetime]")
     if time_node:
@@ -774,110 +442,251 @@ def extract_date_wa(html: str) -> date | None:
             except ValueError:
                 pass
     # Fallback: "FOR IMMEDIATE RELEASE:" followed by date text
-    import dateparser
     body = tree.body
     if body:
-        text = body.text(separator="\n", strip=True)[:500]
-        match = re.search(
-            r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2},?\s+\d{4})',
-            text,
-        )
+        text = _leading_text(body, 500)
+        match = _WA_DATE_RE.search(text)
         if match:
-            parsed = dateparser.parse(match.group(1))
+            parsed = _parse_date(match.group(1))
             if parsed:
-                return parsed.date()
+                return parsed
     return None
 
 
-async def scrape_wa(db: Database, since: date) -> dict:
-    """Scrape WA press releases from Wayback Machine."""
-    config = WAYBACK_STATES["wa"]
-    stats = {"state": "WA", "found": 0, "stored": 0, "skipped": 0, "errors": 0}
+def _is_pa_detail_url(url: str) -> bool:
+    """PA detail pages have a slug after /taking-action/ and aren't pagination."""
+    if "/taking-action/" not in url:
+        return False
+    path = urlsplit(url).path.rstrip("/")
+    return path != "/taking-action" and not _PA_LISTING_PAGE_RE.match(path)
 
-    results = await query_cdx(
-        "atg.wa.gov/news/news-releases/*",
-        since=since.strftime("%Y%m%d"),
-        limit=5000,
-    )
 
-    # Filter out listing/year pages
+def _is_il_release_url(url: str) -> bool:
+    """IL releases are .html files, not directory listings."""
+    return url.endswith(".html")
+
+
+def _url_path(url: str) -> str:
+    """Dedup key ignoring scheme, host and trailing slash."""
+    return urlsplit(url).path.rstrip("/")
+
+
+def _url_path_casefold(url: str) -> str:
+    """As _url_path, for sites that serve one page under several casings."""
+    return urlsplit(url).path.rstrip("/").lower()
+
+
+# State config for Wayback Machine scraping. Beyond the selectors and
+# patterns, each state may set:
+#   cdx_limit          max CDX rows per query (default 5000)
+#   url_filter         predicate a CDX URL must pass after the excludes
+#   dedup_key          collapses captures of the same page to one key
+#   title_extractor    (tree) -> str, default extract_title
+#   date_extractor     (tree, url) -> date | None
+#   min_body_length    shorter bodies are rejected as nav-only pages
+WAYBACK_STATES = {
+    "ny": {
+        "code": "NY",
+        "name": "New York",
+        "cdx_pattern": "ag.ny.gov/press-release/{year}/*",
+        "years": range(2022, 2027),
+        "body_selector": ".node__content",
+        "title_from_url": True,  # NY URLs contain year/month/slug
+        "date_pattern": r"/press-release/(\d{4})/(\d{1,2})/",
+        "date_extractor": extract_date_ny,
+    },
+    "pa": {
+        "code": "PA",
+        "name": "Pennsylvania",
+        "cdx_pattern": "www.attorneygeneral.gov/taking-action/*",
+        "years": None,  # PA URLs don't have year in path
+        "cdx_limit": 10000,
+        "body_selector": ".entry-content",
+        "exclude_patterns": [
+            r"/taking-action/?$",
+            r"/taking-action/page/\d+",
+            r"/taking-action/?(\?|#)",
+        ],
+        "date_selector": ".entry-date, time, .posted-on",
+        "url_filter": _is_pa_detail_url,
+        "date_extractor": extract_date_pa,
+    },
+    "ct": {
+        "code": "CT",
+        "name": "Connecticut",
+        "cdx_pattern": "portal.ct.gov/ag/press-releases/{year}-press-releases/*",
+        "years": range(2022, 2027),
+        "body_selector": ".content",
+        "exclude_patterns": [
+            r"/\d{4}-press-releases/?$",   # listing pages like /2024-Press-Releases
+            r"/press-releases/?$",          # main listing page
+            r"ag-press-release-template",
+        ],
+        "title_extractor": extract_title_ct,
+        "date_extractor": extract_date_ct,
+        # Minimum body length to reject empty/nav-only pages
+        "min_body_length": 200,
+    },
+    "ma": {
+        "code": "MA",
+        "name": "Massachusetts",
+        "cdx_pattern": "mass.gov/news/ag-*",
+        "years": None,
+        "body_selector": ".page-content",
+        "exclude_patterns": [
+            r"\?.*=",  # URLs with query params are duplicates
+        ],
+        # Deduplicate by path only (ignore http vs https, www vs not)
+        "dedup_key": _url_path,
+        "date_extractor": extract_date_ma,
+    },
+    "il": {
+        "code": "IL",
+        "name": "Illinois",
+        "cdx_pattern": "illinoisattorneygeneral.gov/pressroom/{year}_*",
+        "years": range(2022, 2027),
+        "cdx_limit": 20000,  # one prefix query covers a year of YYYY_MM dirs
+        "body_selector": "td[bgcolor='#FFFFFF']",
+        "exclude_patterns": [
+            r"/index\.html$",
+            r"/pressroom/?$",
+        ],
+        "url_filter": _is_il_release_url,
+        "dedup_key": _url_path,
+        "title_extractor": extract_title_il,
+        "date_extractor": extract_date_il,
+    },
+    "wa": {
+        "code": "WA",
+        "name": "Washington",
+        "cdx_pattern": "atg.wa.gov/news/news-releases/*",
+        "years": None,
+        "body_selector": "#block-atg-content article",
+        "exclude_patterns": [
+            r"/NEWS/NEWS-RELEASES/?$",
+            r"/news/news-releases/?$",
+            r"/news/news-releases/\d{4}$",
+        ],
+        "exclude_flags": re.IGNORECASE,
+        "dedup_key": _url_path_casefold,
+        "date_extractor": extract_date_wa,
+    },
+}
+
+# Exclude patterns are tested against every CDX result, so compile them once
+for _config in WAYBACK_STATES.values():
+    _config["exclude_res"] = [
+        re.compile(pattern, _config.get("exclude_flags", 0))
+        for pattern in _config.get("exclude_patterns", [])
+    ]
+
+
+async def scrape_state(
+    db: Database,
+    state_key: str,
+    since: date,
+    client: httpx.AsyncClient,
+    throttle: Throttle,
+) -> dict:
+    """Scrape one state's press releases from the Wayback Machine.
+
+    CDX index → URL filtering → snapshot fetches → batched inserts, all
+    driven by the state's WAYBACK_STATES entry. ``client`` and ``throttle``
+    are shared by every state in the run.
+    """
+    config = WAYBACK_STATES[state_key]
+    code = config["code"]
+    stats = {"state": code, "found": 0, "stored": 0, "skipped": 0, "errors": 0}
+
+    # Get all archived URLs; year-partitioned states query every year at once
+    years = config["years"]
+    patterns = [config["cdx_pattern"].format(year=year) for year in years] if years else [config["cdx_pattern"]]
+    per_pattern = await asyncio.gather(*(
+        query_cdx(pattern, since=since.strftime("%Y%m%d"),
+                  limit=config.get("cdx_limit", 5000), client=client)
+        for pattern in patterns
+    ))
+    results = []
+    for i, found in enumerate(per_pattern):
+        results.extend(found)
+        if years:
+            logger.info("[%s] CDX year %d: %d URLs", code, years[i], len(found))
+
+    # Filter out listing/index pages and repeat captures of one page
+    exclude_res = config["exclude_res"]
+    url_filter = config.get("url_filter")
+    dedup_key = config.get("dedup_key")
+    seen_keys = set()
     detail_urls = []
-    seen_paths = set()
     for r in results:
         url = r["url"]
-        skip = False
-        for pattern in config["exclude_patterns"]:
-            if re.search(pattern, url, re.IGNORECASE):
-                skip = True
-                break
-        if skip:
+        if any(p.search(url) for p in exclude_res):
             continue
-        path = urlparse(url).path.rstrip("/").lower()
-        if path in seen_paths:
+        if url_filter and not url_filter(url):
             continue
-        seen_paths.add(path)
+        if dedup_key:
+            key = dedup_key(url)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
         detail_urls.append(r)
 
     stats["found"] = len(detail_urls)
-    logger.info("[WA] Total unique detail URLs: %d (from %d CDX results)", len(detail_urls), len(results))
+    logger.info("[%s] Total unique detail URLs: %d (from %d CDX results)",
+                code, len(detail_urls), len(results))
 
     # Filter already-scraped
-    new_urls = []
-    for r in detail_urls:
-        url = r["url"]
-        if not url.startswith("https://"):
-            url = "https://" + url if not url.startswith("http") else url
-        if not db.action_exists(url):
-            new_urls.append({**r, "url": url})
-        else:
-            stats["skipped"] += 1
-
-    logger.info("[WA] New URLs to fetch: %d (skipped %d existing)", len(new_urls), stats["skipped"])
+    new_urls = filter_known_urls(db, detail_urls, stats)
 
-    async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-        for i, entry in enumerate(new_urls):
-            url = entry["url"]
-            ts = entry["timestamp"]
+    logger.info("[%s] New URLs to fetch: %d (skipped %d existing)", code, len(new_urls), stats["skipped"])
 
-            try:
-                html = await fetch_wayback_page(client, ts, url)
-                if not html:
-                    stats["errors"] += 1
-                    continue
-
-                title = extract_title_from_html(html)
-                body = extract_body_text(html, config["body_selector"])
-                pr_date = extract_date_wa(html) or since
-
-                if not title or not body:
-                    stats["errors"] += 1
-                    continue
-
-                if not db.action_exists(url):
-                    with db.get_session() as session:
-                        action = EnforcementAction(
-                            state="WA",
-                            date_announced=pr_date,
-                            action_type="other",
-                            status="announced",
-                            headline=title,
-                            source_url=url,
-                            raw_text=body[:10000],
-                        )
-                        session.add(action)
-                        session.commit()
-                        stats["stored"] += 1
-
-                if (i + 1) % 50 == 0:
-                    logger.info("[WA] Progress: %d/%d fetched, %d stored",
-                                i + 1, len(new_urls), stats["stored"])
-
-                await asyncio.sleep(1.0)
+    # Fetch detail pages
+    title_extractor = config.get("title_extractor", extract_title)
+    date_extractor = config["date_extractor"]
+    body_selector = config["body_selector"]
+    # Reject short/empty body (listing pages, nav-only)
+    min_body_length = config.get("min_body_length", 1)
+    pending: list[dict] = []
+    async for i, entry, html in fetch_snapshots(client, new_urls, throttle):
+        url = entry["url"]
 
-            except Exception as e:
+        try:
+            if isinstance(html, Exception):
+                raise html
+            if not html:
                 stats["errors"] += 1
-                logger.warning("[WA] Error fetching %s: %s", url, e)
+                continue
+
+            tree = HTMLParser(strip_wayback_toolbar(html))
+            title = title_extractor(tree)
+            body = extract_body_text(tree, body_selector)
+            pr_date = date_extractor(tree, url) or since
 
+            if not title or len(body) < min_body_length:
+                stats["errors"] += 1
+                continue
+
+            pending.append({
+                "state": code,
+                "date_announced": pr_date,
+                "action_type": "other",
+                "status": "announced",
+                "headline": title,
+                "source_url": url,
+                "raw_text": body[:10000],
+            })
+            if len(pending) >= STORE_BATCH_SIZE:
+                _store_batch(db, pending, stats)
+
+            if (i + 1) % 50 == 0:
+                logger.info("[%s] Progress: %d/%d fetched, %d stored",
+                            code, i + 1, len(new_urls), stats["stored"])
+
+        except Exception as e:
+            stats["errors"] += 1
+            logger.warning("[%s] Error fetching %s: %s", code, url, e)
+
+    _store_batch(db, pending, stats)
     return stats
 
 
@@ -885,30 +694,47 @@ async def run_all(since: date, states: list[str]):
     db = Database()
     db.create_tables()
 
-    tasks = []
-    if "ny" in states:
-        tasks.append(scrape_ny(db, since))
-    if "pa" in states:
-        tasks.append(scrape_pa(db, since))
-    if "ct" in states:
-        tasks.append(scrape_ct(db, since))
-    if "ma" in states:
-        tasks.append(scrape_ma(db, since))
-    if "il" in states:
-        tasks.append(scrape_il(db, since))
-    if "wa" in states:
-        tasks.append(scrape_wa(db, since))
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    keys = [key for key in WAYBACK_STATES if key in states]
+    limits = httpx.Limits(
+        max_connections=FETCH_CONCURRENCY * len(keys),
+        max_keepalive_connections=FETCH_CONCURRENCY * len(keys),
+    )
+    throttle = Throttle(FETCH_RATE)
+    # With h2 installed the in-flight snapshots multiplex over a few
+    # HTTP/2 connections instead of holding one TCP+TLS connection each
+    async with httpx.AsyncClient(
+        timeout=CLIENT_TIMEOUT,
+        follow_redirects=True,
+        limits=limits,
+        http2=h2 is not None,
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+    ) as client:
+
+        async def run_state(key: str) -> dict | None:
+            try:
+                return await scrape_state(db, key, since, client, throttle)
+            except Exception as e:
+                logger.error("[%s] Failed: %s", key, e)
+                return None
+
+        # Report each state as it finishes, so one slow archive doesn't hold
+        # back the others' results
+        results = {}
+        for next_done in asyncio.as_completed([run_state(key) for key in keys]):
+            r = await next_done
+            if r is None:
+                continue
+            logger.info(
+                "[%s] Done: %d found, %d stored, %d skipped, %d errors",
+                r["state"], r["found"], r["stored"], r["skipped"], r["errors"],
+            )
+            results[r["state"]] = r
 
     logger.info("\n" + "=" * 60)
     logger.info("WAYBACK SCRAPE SUMMARY")
     logger.info("=" * 60)
     total_stored = 0
-    for r in results:
-        if isinstance(r, Exception):
-            logger.error("Failed: %s", r)
-            continue
+    for r in results.values():
         logger.info(
             "  %-5s: %4d found, %4d stored, %3d skipped, %3d errors",
             r["state"], r["found"], r["stored"], r["skipped"], r["errors"],
@@ -925,7 +751,9 @@ def main(since, states):
     state_list = [s.strip().lower() for s in states.split(",")]
     logger.info("Wayback scraping states: %s since %s", state_list, since_date)
     start = time.time()
-    asyncio.run(run_all(since_date, state_list))
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_all(since_date, state_list))
     elapsed = time.time() - start
     logger.info("Total time: %.1f minutes", elapsed / 60)
 
@@ -4,15 +4,23 @@ from __future__ import annotations
 
 import csv
 import io
+import json
+import threading
+import time
 from collections.abc import Generator
 from datetime import date
 from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy import Integer, select, func, desc, and_, case
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder is used without it
+    orjson = None
+from sqlalchemy import Float, Integer, select, func, desc, and_, case, cast, lambda_stmt
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from src.storage.database import Database
 from src.storage.models import (
@@ -26,9 +34,21 @@ from src.storage.models import (
 
 router = APIRouter()
 
+# Rows fetched per round-trip (and flushed per chunk) by the streaming CSV export
+EXPORT_BATCH_SIZE = 1000
+
+# /stats responses are served from memory for this many seconds; the
+# data only changes once per scrape run
+STATS_CACHE_TTL = 300.0
+
 # Module-level database reference, set via configure_db() or overridden in tests.
 _db: Database | None = None
 
+# (expires_at, response) for /stats; the lock stops concurrent misses
+# from all running the aggregates at once
+_stats_cache: tuple[float, dict] | None = None
+_stats_lock = threading.Lock()
+
 
 def _escape_like(value: str) -> str:
     """Escape special SQL LIKE characters."""
@@ -37,8 +57,9 @@ def _escape_like(value: str) -> str:
 
 def configure_db(db: Database | None) -> None:
     """Set the database instance used by all routes."""
-    global _db
+    global _db, _stats_cache
     _db = db
+    _stats_cache = None
 
 
 def _get_db() -> Database:
@@ -76,53 +97,72 @@ def list_actions(
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
 ):
-    """List enforcement actions with filtering."""
-    stmt = (
+    """List enforcement actions with filtering.
+
+    Built as a lambda_stmt: each lambda's code location keys the statement
+    cache and its closure values become bound parameters, so repeat calls
+    with the same filter combination skip statement construction entirely.
+    """
+    stmt = lambda_stmt(lambda: (
         select(EnforcementAction)
         .options(
-            joinedload(EnforcementAction.action_defendants).joinedload(ActionDefendant.defendant),
-            joinedload(EnforcementAction.violation_categories),
+            selectinload(EnforcementAction.action_defendants).joinedload(ActionDefendant.defendant),
+            selectinload(EnforcementAction.violation_categories),
             joinedload(EnforcementAction.monetary_terms),
+            # Anything _serialize_action touches must be loaded above;
+            # a missed relationship raises instead of lazy-loading per row
+            raiseload("*"),
         )
-    )
+    ))
 
+    # Values are computed outside the lambdas; only plain closure
+    # variables are turned into bound parameters
     if state:
-        stmt = stmt.where(EnforcementAction.state == state.upper())
+        state_code = state.upper()
+        stmt += lambda s: s.where(EnforcementAction.state == state_code)
     if action_type:
-        stmt = stmt.where(EnforcementAction.action_type == action_type)
+        stmt += lambda s: s.where(EnforcementAction.action_type == action_type)
     if since:
-        stmt = stmt.where(EnforcementAction.date_announced >= since)
+        stmt += lambda s: s.where(EnforcementAction.date_announced >= since)
     if until:
-        stmt = stmt.where(EnforcementAction.date_announced <= until)
+        stmt += lambda s: s.where(EnforcementAction.date_announced <= until)
     if q:
-        stmt = stmt.where(EnforcementAction.headline.ilike(f"%{_escape_like(q)}%", escape="\\"))
+        headline_pattern = f"%{_escape_like(q)}%"
+        stmt += lambda s: s.where(EnforcementAction.headline.ilike(headline_pattern, escape="\\"))
+    # Collection filters go through EXISTS rather than a JOIN, so an action
+    # matching several defendants or categories still comes back once
     if category:
-        stmt = stmt.join(ViolationCategory).where(ViolationCategory.category == category)
+        stmt += lambda s: s.where(
+            EnforcementAction.violation_categories.any(ViolationCategory.category == category)
+        )
     if defendant:
-        stmt = (
-            stmt.join(ActionDefendant)
-            .join(Defendant)
-            .where(
-                Defendant.canonical_name.ilike(f"%{_escape_like(defendant)}%", escape="\\")
-                | Defendant.raw_name.ilike(f"%{_escape_like(defendant)}%", escape="\\")
+        name_pattern = f"%{_escape_like(defendant)}%"
+        stmt += lambda s: s.where(
+            EnforcementAction.action_defendants.any(
+                ActionDefendant.defendant.has(
+                    Defendant.canonical_name.ilike(name_pattern, escape="\\")
+                    | Defendant.raw_name.ilike(name_pattern, escape="\\")
+                )
             )
         )
     if min_amount:
-        stmt = stmt.join(MonetaryTerms).where(
-            MonetaryTerms.total_amount >= Decimal(str(min_amount))
-        )
+        amount = Decimal(str(min_amount))
+        stmt += lambda s: s.join(MonetaryTerms).where(MonetaryTerms.total_amount >= amount)
 
-    stmt = stmt.order_by(desc(EnforcementAction.date_announced))
-    stmt = stmt.offset(offset).limit(limit)
+    stmt += lambda s: (
+        s.order_by(desc(EnforcementAction.date_announced))
+        .offset(offset)
+        .limit(limit)
+    )
 
-    actions = session.execute(stmt).unique().scalars().all()
+    actions = session.scalars(stmt).all()
 
-    return {
+    return _json_response({
         "count": len(actions),
         "offset": offset,
         "limit": limit,
         "results": [_serialize_action(a) for a in actions],
-    }
+    })
 
 
 @router.get("/actions/{action_id}")
@@ -131,18 +171,19 @@ def get_action(action_id: str, session: Session = Depends(get_db_session)):
     action = session.execute(
         select(EnforcementAction)
         .options(
-            joinedload(EnforcementAction.action_defendants).joinedload(ActionDefendant.defendant),
-            joinedload(EnforcementAction.violation_categories),
+            selectinload(EnforcementAction.action_defendants).joinedload(ActionDefendant.defendant),
+            selectinload(EnforcementAction.violation_categories),
             joinedload(EnforcementAction.monetary_terms),
-            joinedload(EnforcementAction.statutes_cited),
+            selectinload(EnforcementAction.statutes_cited),
+            raiseload("*"),
         )
         .where(EnforcementAction.id == action_id)
-    ).unique().scalar_one_or_none()
+    ).scalar_one_or_none()
 
     if not action:
         raise HTTPException(status_code=404, detail="Action not found")
 
-    return _serialize_action(action, include_body=True)
+    return _json_response(_serialize_action(action, include_body=True))
 
 
 # ── Analytics endpoints ───────────────────────────────────────────────────
@@ -150,46 +191,55 @@ def get_action(action_id: str, session: Session = Depends(get_db_session)):
 
 @router.get("/stats")
 def get_stats(session: Session = Depends(get_db_session)):
-    """Summary statistics for the entire dataset."""
-    total = session.execute(select(func.count(EnforcementAction.id))).scalar_one()
-    total_defendants = session.execute(select(func.count(Defendant.id))).scalar_one()
+    """Summary statistics for the entire dataset, cached for STATS_CACHE_TTL."""
+    global _stats_cache
+    with _stats_lock:
+        now = time.monotonic()
+        if _stats_cache is None or _stats_cache[0] <= now:
+            _stats_cache = (now + STATS_CACHE_TTL, _compute_stats(session))
+        return _stats_cache[1]
+
+
+def _compute_stats(session: Session) -> dict:
+    """Run the /stats aggregates against the database."""
+    # Scalar totals in one round-trip
+    total, total_defendants, total_monetary = session.execute(lambda_stmt(lambda: select(
+        select(func.count(EnforcementAction.id)).scalar_subquery(),
+        select(func.count(Defendant.id)).scalar_subquery(),
+        select(func.coalesce(func.sum(MonetaryTerms.total_amount), 0)).scalar_subquery(),
+    ))).one()
 
     # By state
-    by_state = session.execute(
+    by_state = session.execute(lambda_stmt(lambda: (
         select(
             EnforcementAction.state,
             func.count(EnforcementAction.id),
         )
         .group_by(EnforcementAction.state)
         .order_by(desc(func.count(EnforcementAction.id)))
-    ).all()
+    ))).all()
 
     # By action type
-    by_type = session.execute(
+    by_type = session.execute(lambda_stmt(lambda: (
         select(
             EnforcementAction.action_type,
             func.count(EnforcementAction.id),
         )
         .group_by(EnforcementAction.action_type)
-    ).all()
+    ))).all()
 
     # By category
-    by_category = session.execute(
+    by_category = session.execute(lambda_stmt(lambda: (
         select(
             ViolationCategory.category,
             func.count(ViolationCategory.id),
         )
         .group_by(ViolationCategory.category)
         .order_by(desc(func.count(ViolationCategory.id)))
-    ).all()
-
-    # Total monetary
-    total_monetary = session.execute(
-        select(func.sum(MonetaryTerms.total_amount))
-    ).scalar_one() or 0
+    ))).all()
 
     # Top defendants by action count
-    top_defendants = session.execute(
+    top_defendants = session.execute(lambda_stmt(lambda: (
         select(
             Defendant.canonical_name,
             func.count(ActionDefendant.action_id).label("count"),
@@ -199,7 +249,7 @@ def get_stats(session: Session = Depends(get_db_session)):
         .group_by(Defendant.canonical_name)
         .order_by(desc("count"))
         .limit(20)
-    ).all()
+    ))).all()
 
     return {
         "total_actions": total,
@@ -237,17 +287,20 @@ def get_timeline(
     else:
         date_expr = func.strftime("%Y", EnforcementAction.date_announced)
 
-    stmt = select(
+    # date_expr is a SQL construct, so the lambda folds it into the cache
+    # key: each granularity gets its own cached statement
+    stmt = lambda_stmt(lambda: select(
         date_expr.label("period"),
         func.count(EnforcementAction.id).label("count"),
-    )
+    ))
 
     if state:
-        stmt = stmt.where(EnforcementAction.state == state.upper())
+        state_code = state.upper()
+        stmt += lambda s: s.where(EnforcementAction.state == state_code)
     if category:
-        stmt = stmt.join(ViolationCategory).where(ViolationCategory.category == category)
+        stmt += lambda s: s.join(ViolationCategory).where(ViolationCategory.category == category)
 
-    stmt = stmt.group_by("period").order_by("period")
+    stmt += lambda s: s.group_by("period").order_by("period")
     rows = session.execute(stmt).all()
 
     return [{"period": p, "count": c} for p, c in rows]
@@ -256,19 +309,19 @@ def get_timeline(
 @router.get("/states")
 def list_states(session: Session = Depends(get_db_session)):
     """List all states with data."""
-    rows = session.execute(
+    rows = session.execute(lambda_stmt(lambda: (
         select(
             EnforcementAction.state,
             func.count(EnforcementAction.id).label("count"),
-            func.sum(MonetaryTerms.total_amount).label("total_amount"),
+            func.coalesce(func.sum(MonetaryTerms.total_amount), 0).label("total_amount"),
         )
         .outerjoin(MonetaryTerms)
         .group_by(EnforcementAction.state)
         .order_by(desc("count"))
-    ).all()
+    ))).all()
 
     return [
-        {"state": s, "count": c, "total_amount": float(a or 0)}
+        {"state": s, "count": c, "total_amount": float(a)}
         for s, c, a in rows
     ]
 
@@ -278,52 +331,87 @@ def list_states(session: Session = Depends(get_db_session)):
 
 @router.get("/export/csv")
 def export_csv(
-    session: Session = Depends(get_db_session),
     state: Optional[str] = Query(None),
     since: Optional[date] = Query(None),
 ):
-    """Export enforcement actions as CSV."""
+    """Export enforcement actions as CSV, streamed in chunks as rows are read.
+
+    Built as one Core query: defendant and category names are pre-joined
+    with GROUP_CONCAT, so rows go straight from the cursor to csv.writer
+    without materializing ORM objects.
+    """
+    defendant_names = (
+        select(
+            ActionDefendant.action_id,
+            func.group_concat(
+                func.coalesce(func.nullif(Defendant.canonical_name, ""), Defendant.raw_name),
+                ", ",
+            ).label("names"),
+        )
+        .join(Defendant)
+        .group_by(ActionDefendant.action_id)
+        .subquery()
+    )
+    category_names = (
+        select(
+            ViolationCategory.action_id,
+            func.group_concat(ViolationCategory.category, ", ").label("names"),
+        )
+        .group_by(ViolationCategory.action_id)
+        .subquery()
+    )
+
     stmt = (
-        select(EnforcementAction)
-        .options(
-            joinedload(EnforcementAction.action_defendants).joinedload(ActionDefendant.defendant),
-            joinedload(EnforcementAction.violation_categories),
-            joinedload(EnforcementAction.monetary_terms),
+        select(
+            EnforcementAction.id,
+            EnforcementAction.state,
+            EnforcementAction.date_announced,
+            EnforcementAction.action_type,
+            EnforcementAction.status,
+            EnforcementAction.headline,
+            defendant_names.c.names,
+            cast(MonetaryTerms.total_amount, Float),
+            category_names.c.names,
+            EnforcementAction.is_multistate,
+            EnforcementAction.quality_score,
+            EnforcementAction.source_url,
         )
+        .outerjoin(defendant_names, defendant_names.c.action_id == EnforcementAction.id)
+        .outerjoin(MonetaryTerms)
+        .outerjoin(category_names, category_names.c.action_id == EnforcementAction.id)
         .order_by(desc(EnforcementAction.date_announced))
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
     )
     if state:
         stmt = stmt.where(EnforcementAction.state == state.upper())
     if since:
         stmt = stmt.where(EnforcementAction.date_announced >= since)
 
-    actions = session.execute(stmt).unique().scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "id", "state", "date_announced", "action_type", "status",
-        "headline", "defendants", "total_amount", "categories",
-        "is_multistate", "quality_score", "source_url",
-    ])
-
-    for a in actions:
-        defendants = ", ".join(
-            ad.defendant.canonical_name or ad.defendant.raw_name
-            for ad in a.action_defendants
-        )
-        cats = ", ".join(vc.category for vc in a.violation_categories)
-        amount = float(a.monetary_terms.total_amount) if a.monetary_terms else ""
-
+    def generate() -> Generator[str, None, None]:
+        # The generator owns its session: it runs after the endpoint has
+        # returned, so it can't borrow the request-scoped one.
+        buf = io.StringIO()
+        writer = csv.writer(buf)
         writer.writerow([
-            a.id, a.state, a.date_announced, a.action_type, a.status,
-            a.headline, defendants, amount, cats,
-            a.is_multistate, a.quality_score, a.source_url,
+            "id", "state", "date_announced", "action_type", "status",
+            "headline", "defendants", "total_amount", "categories",
+            "is_multistate", "quality_score", "source_url",
         ])
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate(0)
+
+        # csv.writer renders NULLs (no defendants, categories or
+        # monetary terms) as empty fields, same as the old "" values
+        with _get_db().get_session() as session:
+            for partition in session.execute(stmt).partitions():
+                writer.writerows(partition)
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate(0)
 
-    output.seek(0)
     return StreamingResponse(
-        output,
+        generate(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=ag_enforcement_actions.csv"},
     )
@@ -332,6 +420,20 @@ def export_csv(
 # ── Serialization helpers ─────────────────────────────────────────────────
 
 
+def _json_response(payload: dict) -> Response:
+    """Encode an already JSON-native payload, bypassing FastAPI's encoder.
+
+    Returning a dict makes FastAPI walk it with jsonable_encoder before
+    json.dumps; _serialize_action already emits plain str/float/bool/None
+    values, so that walk is pure overhead on large result pages.
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Response(body, media_type="application/json")
+
+
 def _serialize_action(action: EnforcementAction, include_body: bool = False) -> dict:
     """Serialize an EnforcementAction to a JSON-friendly dict."""
     result = {
@@ -282,7 +282,7 @@ def extract(ctx, state_code, extract_all, reprocess):
     """Run extraction pipeline on scraped press releases."""
     import yaml
     from pathlib import Path
-    from sqlalchemy import delete, select
+    from sqlalchemy import delete, select, update
 
     from src.extractors.filter import is_enforcement_action
     from src.extractors.press_release import PressReleaseExtractor
@@ -339,13 +339,15 @@ def extract(ctx, state_code, extract_all, reprocess):
 
                 if not filter_result.is_enforcement:
                     filtered_out += 1
-                    # Mark as processed but low quality
+                    # Mark as processed but low quality; a keyed UPDATE avoids
+                    # re-selecting the row we already hold
                     with db.get_session() as session:
-                        db_action = session.get(EnforcementAction, action.id)
-                        if db_action:
-                            db_action.quality_score = 0.1
-                            db_action.action_type = "other"
-                            session.commit()
+                        session.execute(
+                            update(EnforcementAction)
+                            .where(EnforcementAction.id == action.id)
+                            .values(quality_score=0.1, action_type="other")
+                        )
+                        session.commit()
                     progress.advance(task)
                     continue
 
@@ -499,15 +501,12 @@ def export(ctx, fmt, output_path, state_code, since_date):
 @click.pass_context
 def analyze(ctx, output_path):
     """Generate analytics insights report."""
-    from scripts.analyze import generate_report
+    from scripts.analyze import write_report
 
     db: Database = ctx.obj["db"]
-    report = generate_report(db)
-
     out = Path(output_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(report, encoding="utf-8")
-    console.print(f"Report written to [cyan]{out}[/cyan] ({len(report.splitlines())} lines)")
+    line_count = write_report(db, out)
+    console.print(f"Report written to [cyan]{out}[/cyan] ({line_count} lines)")
 
 
 @cli.command("resolve-entities")
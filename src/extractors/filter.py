@@ -259,6 +259,14 @@ _HEADLINE_NON_ENFORCEMENT_RE = [
     re.compile(r'(?:murder|manslaughter|homicide)\s+(?:case|trial|conviction|charge)', re.IGNORECASE),
 ]
 
+# All of the above folded into one alternation, so a headline is scanned once
+# rather than once per pattern. The patterns are written in lowercase, so
+# matching the lowercased headline case-sensitively is equivalent to their
+# IGNORECASE flag and lets the engine use its faster literal scans.
+_HEADLINE_NON_ENFORCEMENT = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in _HEADLINE_NON_ENFORCEMENT_RE)
+)
+
 
 def _keyword_screen(headline: str, body_first_500: str) -> str:
     """Stage 1: Keyword screen.
@@ -268,15 +276,16 @@ def _keyword_screen(headline: str, body_first_500: str) -> str:
         "reject" — non-enforcement keywords only, filter out
         "ambiguous" — neither strong signal, proceed to stage 2 for safety
     """
-    combined = (headline + " " + body_first_500).lower()
-
     # Check headline-level overrides first — these are strong non-enforcement signals
     # that override enforcement keywords appearing in body/context
-    if any(p.search(headline) for p in _HEADLINE_NON_ENFORCEMENT_RE):
+    if _HEADLINE_NON_ENFORCEMENT.search(headline.lower()):
         # Even if enforcement keywords appear (e.g., "civil penalties" in legislation context),
         # the headline pattern indicates this is NOT an enforcement action
         return "reject"
 
+    # Only build the lowercased body window once the headline hasn't decided it
+    combined = (headline + " " + body_first_500).lower()
+
     has_enforcement = any(kw in combined for kw in _ENFORCEMENT_KEYWORDS)
     has_non_enforcement = any(kw in combined for kw in _NON_ENFORCEMENT_KEYWORDS)
 
@@ -335,15 +344,21 @@ def _pattern_validation(headline: str, body_text: str) -> bool:
     - A court name
 
     Returns True if the press release looks like an enforcement action.
+
+    Checks short-circuit over the full body: the defendant pattern fails on
+    most non-enforcement text, and the statute pattern — by far the slowest —
+    runs last, only when neither a dollar amount nor a court was found.
     """
     combined = headline + " " + body_text
 
-    has_defendant = bool(_HAS_DEFENDANT.search(combined))
-    has_dollar = bool(_HAS_DOLLAR.search(combined))
-    has_statute = bool(_HAS_STATUTE.search(combined))
-    has_court = bool(_HAS_COURT.search(combined))
+    if not _HAS_DEFENDANT.search(combined):
+        return False
 
-    return has_defendant and (has_dollar or has_statute or has_court)
+    return bool(
+        _HAS_DOLLAR.search(combined)
+        or _HAS_COURT.search(combined)
+        or _HAS_STATUTE.search(combined)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -281,6 +281,7 @@ class EntityResolver:
         self._metadata: dict[str, dict] = {}      # canonical → metadata
         self._canonical_names: set[str] = set()   # all known canonical names
         self._review_queue: list[tuple[str, str, float]] = []  # (raw, candidate, score)
+        self._resolve_cache: dict[str, tuple[str, float]] = {}  # raw name → result
         self._load_config()
 
     def _load_config(self) -> None:
@@ -319,7 +320,20 @@ class EntityResolver:
             - 1.0 for exact alias match
             - 0.85-0.99 for fuzzy match above threshold
             - 0.5 for new entity (no match found)
+
+        Results are memoized per raw name: the same defendant recurs across
+        many press releases, and fuzzy matching scans every canonical name.
+        A repeated name always resolves to what it resolved to first.
         """
+        cached = self._resolve_cache.get(raw_name)
+        if cached is not None:
+            return cached
+        result = self._resolve_uncached(raw_name)
+        self._resolve_cache[raw_name] = result
+        return result
+
+    def _resolve_uncached(self, raw_name: str) -> tuple[str, float]:
+        """Run the full cleaning → alias → fuzzy pipeline for one name."""
         cleaned = self.clean_name(raw_name)
         if not cleaned:
             return "", 0.0
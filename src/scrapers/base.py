@@ -51,6 +51,16 @@ BROWSER_USER_AGENT = (
 MAX_RETRIES = 3
 BASE_TIMEOUT = 30.0
 
+# Connection pool for a scraper's client. Rate limiting spaces requests out by
+# seconds, and with several fetches in flight each pooled connection can idle
+# well past httpx's 5s default expiry; a longer expiry keeps connections (and
+# their TLS sessions) reused for the whole run instead of re-handshaking.
+CONNECTION_LIMITS = httpx.Limits(
+    max_connections=16,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0,
+)
+
 
 class BaseScraper(ABC):
     """Config-driven scraper that handles common AG website patterns.
@@ -73,6 +83,9 @@ class BaseScraper(ABC):
         self.use_browser_ua: bool = config.get("use_browser_ua", False)
 
         self._client: httpx.AsyncClient | None = None
+        # Request pacing shared by every concurrent fetch on this scraper
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
 
     # ------------------------------------------------------------------
     # HTTP helpers
@@ -84,6 +97,7 @@ class BaseScraper(ABC):
             self._client = httpx.AsyncClient(
                 headers={"User-Agent": ua},
                 timeout=httpx.Timeout(BASE_TIMEOUT),
+                limits=CONNECTION_LIMITS,
                 follow_redirects=True,
             )
         return self._client
@@ -92,6 +106,19 @@ class BaseScraper(ABC):
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
+    async def _throttle(self) -> None:
+        """Wait until ``rate_limit`` seconds have passed since the last request started.
+
+        Callers queue on a lock, so concurrent fetches still hit the site at
+        most once per ``rate_limit`` while their responses overlap.
+        """
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_request_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_request_at = loop.time() + self.rate_limit
+
     async def fetch(self, url: str) -> str:
         """Fetch a URL with retries and rate limiting. Returns HTML text."""
         client = await self._get_client()
@@ -99,7 +126,7 @@ class BaseScraper(ABC):
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                await asyncio.sleep(self.rate_limit)
+                await self._throttle()
                 resp = await client.get(url)
                 resp.raise_for_status()
                 return resp.text
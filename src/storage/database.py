@@ -7,10 +7,11 @@ and performing common queries. Uses SQLAlchemy 2.0 with SQLite by default.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import create_engine, select, func
+from sqlalchemy import create_engine, event, select, func
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.storage.models import (
@@ -25,6 +26,42 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = Path("data/ag_enforcement.db")
 
+# URLs per IN (...) lookup; older SQLite builds cap bound parameters at 999
+URL_LOOKUP_CHUNK = 900
+
+# Applied to every new SQLite connection. The pipeline is commit-heavy and
+# the database is local, so WAL + synchronous=NORMAL trades the per-commit
+# fsync of the main file for a checkpointed write-ahead log, truncated back
+# to journal_size_limit after each checkpoint.
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-131072",
+    "journal_size_limit=6144000",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """SQLAlchemy ``connect`` hook that tunes each raw DBAPI connection.
+
+    Also turns off pysqlite's own transaction handling, which only emits
+    BEGIN ahead of DML. Left on, a SAVEPOINT issued first would open the
+    transaction itself and its RELEASE would commit; ``_begin_transaction``
+    emits BEGIN instead, so ``Session.begin_nested()`` nests properly.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+    dbapi_connection.isolation_level = None
+
+
+def _begin_transaction(conn) -> None:
+    """SQLAlchemy ``begin`` hook: start the DBAPI transaction explicitly."""
+    conn.exec_driver_sql("BEGIN")
+
 
 class Database:
     """Manages the SQLite database connection and provides query helpers."""
@@ -36,11 +73,18 @@ class Database:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
         self.engine = create_engine(f"sqlite:///{db_path}", echo=echo)
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
+        event.listen(self.engine, "begin", _begin_transaction)
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def create_tables(self) -> None:
-        """Create all tables if they don't exist."""
+        """Create all tables and indexes if they don't exist."""
         Base.metadata.create_all(self.engine)
+        # create_all() only emits CREATE INDEX alongside CREATE TABLE, so
+        # indexes added to the models after a table exists are created here.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
         logger.info("Database tables created at %s", self.db_path)
 
     def get_session(self) -> Session:
@@ -65,6 +109,37 @@ class Database:
             ).scalar_one_or_none()
             return result is not None
 
+    def existing_urls(self, urls: Iterable[str]) -> set[str]:
+        """Return the subset of ``urls`` already stored as source URLs.
+
+        Batch form of ``action_exists``: one IN query per chunk of
+        ``URL_LOOKUP_CHUNK`` URLs, keeping each under SQLite's bound-parameter
+        limit.
+        """
+        urls = list(dict.fromkeys(urls))
+        found: set[str] = set()
+        with self.get_session() as session:
+            for start in range(0, len(urls), URL_LOOKUP_CHUNK):
+                found.update(session.execute(
+                    select(EnforcementAction.source_url).where(
+                        EnforcementAction.source_url.in_(urls[start:start + URL_LOOKUP_CHUNK])
+                    )
+                ).scalars())
+        return found
+
+    def get_known_urls(self, state: str) -> set[str]:
+        """Return every stored source URL for a state.
+
+        Lets a scraper filter a whole listing against the database with one
+        query instead of calling ``action_exists`` per item.
+        """
+        with self.get_session() as session:
+            return set(session.execute(
+                select(EnforcementAction.source_url).where(
+                    EnforcementAction.state == state.upper()
+                )
+            ).scalars())
+
     def get_action_count(self, state: Optional[str] = None) -> int:
         """Return the total number of enforcement actions, optionally filtered by state."""
         with self.get_session() as session:
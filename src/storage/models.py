@@ -17,6 +17,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     Numeric,
@@ -57,6 +58,15 @@ class MultistateAction(Base):
 
 class EnforcementAction(Base):
     __tablename__ = "enforcement_actions"
+    __table_args__ = (
+        # Keyset scan over unprocessed rows: WHERE quality_score = 0 AND id > ?
+        Index("ix_enforcement_actions_quality_score_id", "quality_score", "id"),
+        # Clean export: WHERE is_federal_litigation = 0 ORDER BY date_announced DESC
+        Index(
+            "ix_enforcement_actions_federal_date",
+            "is_federal_litigation", "date_announced", "quality_score",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid_default)
     state: Mapped[str] = mapped_column(String(2), nullable=False, index=True)
@@ -64,7 +74,7 @@ class EnforcementAction(Base):
     date_filed: Mapped[date | None] = mapped_column(Date, nullable=True)
     date_resolved: Mapped[date | None] = mapped_column(Date, nullable=True)
     action_type: Mapped[str] = mapped_column(
-        String(40), nullable=False, default="other",
+        String(40), nullable=False, default="other", index=True,
     )
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="announced",
@@ -140,7 +150,7 @@ class ViolationCategory(Base):
     action_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("enforcement_actions.id"), nullable=False, index=True,
     )
-    category: Mapped[str] = mapped_column(String(100), nullable=False)
+    category: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     subcategory: Mapped[str | None] = mapped_column(String(200), nullable=True)
     confidence: Mapped[float] = mapped_column(Float, default=1.0)
 
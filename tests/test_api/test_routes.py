@@ -11,6 +11,7 @@ from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from src.api.server import app
 from src.api.routes import configure_db
@@ -142,6 +143,44 @@ class TestListActions:
         assert data["limit"] == 1
         assert data["offset"] == 0
 
+    def test_query_count_independent_of_result_size(self, client, test_db):
+        """Relationships are eager-loaded in bulk, not lazily per action."""
+        def count_queries():
+            statements = []
+
+            def listener(conn, cursor, statement, *_):
+                statements.append(statement)
+
+            event.listen(test_db.engine, "before_cursor_execute", listener)
+            try:
+                resp = client.get("/api/v1/actions")
+            finally:
+                event.remove(test_db.engine, "before_cursor_execute", listener)
+            assert resp.status_code == 200
+            return len(statements)
+
+        baseline = count_queries()
+
+        with test_db.get_session() as session:
+            for i in range(10):
+                session.add(EnforcementAction(
+                    id=f"bulk-action-{i}",
+                    state="TX",
+                    date_announced=date(2023, 1, i + 1),
+                    action_type="settlement",
+                    status="settled",
+                    headline=f"Bulk Action {i}",
+                    source_url=f"https://example.com/bulk-{i}",
+                    action_defendants=[ActionDefendant(
+                        defendant=Defendant(raw_name=f"Bulk Defendant {i}"),
+                    )],
+                    violation_categories=[ViolationCategory(category="privacy")],
+                    monetary_terms=MonetaryTerms(total_amount=Decimal(1000 * i)),
+                ))
+            session.commit()
+
+        assert count_queries() == baseline
+
 
 class TestGetAction:
     def test_existing_action_returns_200(self, client):
@@ -177,6 +216,20 @@ class TestStats:
         assert data["total_actions"] == 2
         assert data["total_defendants"] == 1
 
+    def test_stats_served_from_cache(self, client, test_db):
+        first = client.get("/api/v1/stats").json()
+
+        with test_db.get_session() as session:
+            session.add(EnforcementAction(
+                state="TX",
+                date_announced=date(2024, 8, 1),
+                headline="AG Reaches Settlement",
+                source_url="https://example.com/cached-stats",
+            ))
+            session.commit()
+
+        assert client.get("/api/v1/stats").json() == first
+
 
 class TestExportCSV:
     def test_csv_export_returns_200(self, client):
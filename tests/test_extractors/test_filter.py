@@ -97,6 +97,13 @@ class TestKeywordScreen:
         )
         assert result.is_enforcement is False
 
+    def test_headline_override_ignores_case(self):
+        result = is_enforcement_action(
+            "ATTORNEY GENERAL ISSUES STATEMENT ON LEGISLATION AUTHORIZING CIVIL PENALTIES",
+            "The bill authorizes civil penalties for violations.",
+        )
+        assert result.is_enforcement is False
+
     def test_serial_murder_guilty_plea_is_not_enforcement(self):
         result = is_enforcement_action(
             "Statement from AG Yost on Guilty Plea in Serial Murder Case",
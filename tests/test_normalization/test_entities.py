@@ -167,3 +167,8 @@ class TestResolverIntegration:
         # Check that review queue is accessible
         queue = resolver.get_review_queue()
         assert isinstance(queue, list)
+
+    def test_repeated_name_is_memoized(self, resolver):
+        first = resolver.resolve("Acme Widgets Corp")
+        assert resolver.resolve("Acme Widgets Corp") == first
+        assert resolver._resolve_cache["Acme Widgets Corp"] == first
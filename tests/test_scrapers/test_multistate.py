@@ -4,6 +4,8 @@ These tests run against real HTML snapshots downloaded from live AG websites.
 Each state's listing page parsing and detail page body extraction are verified.
 """
 
+import asyncio
+import itertools
 from datetime import date
 from pathlib import Path
 
@@ -343,3 +345,27 @@ class TestNewStateRegistry:
         # VA and PA deferred due to near-zero scrape yields
         for state in ["california", "new_york", "ohio", "oregon", "texas"]:
             assert state in active, f"{state} should be active"
+
+
+# ── Request pacing ────────────────────────────────────────────────────────
+
+
+class TestRateLimit:
+    """Concurrent fetches on one scraper share its rate limit."""
+
+    def test_concurrent_requests_are_spaced(self):
+        scraper = get_scraper("ohio")
+        scraper.rate_limit = 0.05
+        starts: list[float] = []
+
+        async def request():
+            await scraper._throttle()
+            starts.append(asyncio.get_running_loop().time())
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(4)))
+
+        asyncio.run(run())
+        gaps = [b - a for a, b in itertools.pairwise(starts)]
+        assert len(starts) == 4
+        assert all(gap >= 0.045 for gap in gaps)
@@ -0,0 +1,124 @@
+"""Tests for the bulk extraction batch loop.
+
+Covers per-action isolation: an action that fails partway through is
+rolled back on its own while the rest of its batch is still committed.
+"""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+import yaml
+from sqlalchemy import func, select
+
+from scripts.bulk_extract import process_batch
+from src.extractors.press_release import PressReleaseExtractor
+from src.normalization.entities import EntityResolver
+from src.storage.database import Database
+from src.storage.models import (
+    ActionDefendant,
+    EnforcementAction,
+    MonetaryTerms,
+    StatuteCited,
+    ViolationCategory,
+)
+
+TAXONOMY_PATH = Path(__file__).resolve().parents[2] / "config" / "taxonomy.yaml"
+
+COMPANIES = ["Acme Widgets Inc.", "Globex Holdings Inc.", "Initech Software Inc."]
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A file database holding three unprocessed settlement announcements."""
+    d = Database(tmp_path / "extract.db")
+    d.create_tables()
+    with d.get_session() as session:
+        for i, company in enumerate(COMPANIES):
+            session.add(EnforcementAction(
+                id=f"action-{i}",
+                state="CA",
+                date_announced=date(2024, 1, i + 1),
+                headline=f"Attorney General Secures $5 Million Settlement with {company}",
+                source_url=f"https://example.com/action-{i}",
+                raw_text=(
+                    f"The Attorney General today announced a $5 million settlement with {company} "
+                    "resolving allegations that the company engaged in deceptive advertising in "
+                    "violation of the Consumer Protection Act."
+                ),
+            ))
+        session.commit()
+    return d
+
+
+@pytest.fixture
+def extractor():
+    with open(TAXONOMY_PATH) as f:
+        return PressReleaseExtractor(yaml.safe_load(f))
+
+
+def _run_batch(db, extractor, resolver):
+    stats = dict.fromkeys([
+        "extracted", "filtered_out", "errors", "low_quality",
+        "defendants_resolved", "defendants_new", "monetary_capped",
+    ], 0)
+    defendant_ids: dict[str, str] = {}
+    with db.get_session() as session:
+        actions = session.scalars(select(EnforcementAction).order_by(EnforcementAction.id)).all()
+        process_batch(session, actions, extractor, resolver, defendant_ids, stats)
+        session.commit()
+    return stats, defendant_ids
+
+
+def _child_counts(session, action_id):
+    return [
+        session.scalar(select(func.count()).select_from(model).where(model.action_id == action_id))
+        for model in (ViolationCategory, StatuteCited, MonetaryTerms, ActionDefendant)
+    ]
+
+
+class TestProcessBatch:
+    def test_database_error_rolls_back_only_that_action(self, db, extractor):
+        # A second MonetaryTerms row for action-1 violates the unique
+        # action_id once process_action flushes its own
+        with db.get_session() as session:
+            session.add(MonetaryTerms(action_id="action-1", total_amount=Decimal("1")))
+            session.commit()
+
+        stats, _ = _run_batch(db, extractor, EntityResolver())
+
+        assert stats["errors"] == 1
+        assert stats["extracted"] == 2
+        with db.get_session() as session:
+            failed = session.get(EnforcementAction, "action-1")
+            assert failed.quality_score == 0.1
+            assert failed.action_type == "other"
+            assert _child_counts(session, "action-1") == [0, 0, 1, 0]
+            for action_id in ("action-0", "action-2"):
+                assert session.get(EnforcementAction, action_id).quality_score > 0.1
+                assert all(_child_counts(session, action_id))
+
+    def test_exception_after_writes_rolls_back_only_that_action(self, db, extractor):
+        resolver = EntityResolver()
+        get_metadata = resolver.get_metadata
+
+        def failing_get_metadata(canonical):
+            # Raised in the defendant step, after categories and statutes
+            # for the action have already been inserted
+            if "Globex" in canonical:
+                raise RuntimeError("metadata lookup failed")
+            return get_metadata(canonical)
+
+        resolver.get_metadata = failing_get_metadata
+
+        stats, defendant_ids = _run_batch(db, extractor, resolver)
+
+        assert stats["errors"] == 1
+        assert stats["extracted"] == 2
+        assert not any("Globex" in name for name in defendant_ids)
+        with db.get_session() as session:
+            assert session.get(EnforcementAction, "action-1").quality_score == 0.1
+            assert _child_counts(session, "action-1") == [0, 0, 0, 0]
+            assert all(_child_counts(session, "action-0"))
+            assert all(_child_counts(session, "action-2"))
@@ -6,6 +6,7 @@ Tests upsert idempotency, search, and dedup key (source_url uniqueness).
 from datetime import date
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from src.storage.database import Database
@@ -29,6 +30,35 @@ class TestTableCreation:
         assert stats["total_scrape_runs"] == 0
 
 
+class TestPragmas:
+    def test_file_db_uses_wal(self, tmp_path):
+        """File-backed databases should be opened in WAL mode with relaxed sync."""
+        d = Database(tmp_path / "pragmas.db")
+        with d.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            # synchronous=NORMAL is reported as 1
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            assert conn.exec_driver_sql("PRAGMA journal_size_limit").scalar() == 6144000
+
+
+class TestIndexes:
+    def test_unprocessed_keyset_query_uses_index(self, db):
+        """The extraction batch query should seek on (quality_score, id), not scan."""
+        stmt = (
+            select(EnforcementAction.id)
+            .where(EnforcementAction.quality_score == 0.0)
+            .where(EnforcementAction.raw_text != "")
+            .where(EnforcementAction.id > "")
+            .order_by(EnforcementAction.id)
+            .limit(100)
+        )
+        with db.engine.connect() as conn:
+            sql = str(stmt.compile(conn, compile_kwargs={"literal_binds": True}))
+            plan = " ".join(row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+        assert "ix_enforcement_actions_quality_score_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
 class TestActionExists:
     def test_nonexistent_url(self, db):
         assert not db.action_exists("https://example.com/does-not-exist")
@@ -46,6 +76,49 @@ class TestActionExists:
         assert db.action_exists("https://example.com/test-1")
 
 
+class TestKnownUrls:
+    def test_returns_urls_for_state_only(self, db):
+        with db.get_session() as session:
+            session.add_all([
+                EnforcementAction(
+                    state=state,
+                    date_announced=date(2024, 1, 1),
+                    headline="Test",
+                    source_url=url,
+                )
+                for state, url in [
+                    ("CA", "https://example.com/ca-1"),
+                    ("CA", "https://example.com/ca-2"),
+                    ("NY", "https://example.com/ny-1"),
+                ]
+            ])
+            session.commit()
+
+        assert db.get_known_urls("ca") == {
+            "https://example.com/ca-1",
+            "https://example.com/ca-2",
+        }
+        assert db.get_known_urls("TX") == set()
+
+    def test_existing_urls_spans_lookup_chunks(self, db, monkeypatch):
+        monkeypatch.setattr("src.storage.database.URL_LOOKUP_CHUNK", 2)
+        with db.get_session() as session:
+            session.add_all([
+                EnforcementAction(
+                    state="CA",
+                    date_announced=date(2024, 1, 1),
+                    headline="Test",
+                    source_url=f"https://example.com/ca-{i}",
+                )
+                for i in range(3)
+            ])
+            session.commit()
+
+        urls = [f"https://example.com/ca-{i}" for i in range(5)]
+        assert db.existing_urls(urls) == set(urls[:3])
+        assert db.existing_urls([]) == set()
+
+
 class TestIdempotency:
     def test_duplicate_source_url_rejected(self, db):
         """Inserting a second action with the same source_url should fail (unique constraint)."""